@@ -0,0 +1,388 @@
+"""
+Arşivlenmiş anketler için tek dosyalık, kolon bazlı (columnar) format.
+
+Dosya düzeni:
+    MAGIC (8) | header_offset (u64) | header_length (u64) | kolon blokları ... | header (zlib'li JSON)
+
+- Tam sayı kolonları null'lanabilir ve "base" kaydırmalı saklanır (0 = NULL, v - base);
+  değer aralığına göre en dar genişlik (B/H/I) seçilir. Sıkıştırılmazlar: okuyucu dosyayı
+  mmap'leyip memoryview.cast ile kopyasız erişir.
+- Seçim kolonları (option id'leri) sözlükle kodlanır: sözlük header'da, satırlarda 1 tabanlı
+  kodlar. Satır başına en fazla bir seçim varsa "single" (yoğun kod dizisi), yoksa "list"
+  (satır başına adet + kodlar) düzeni kullanılır.
+- Metin kolonları STRING_BLOCK_ROWS'luk bloklar halinde zlib ile sıkıştırılır; tek satır
+  okumak yalnızca bir bloğu açar. Boş metin NULL ile aynıdır.
+"""
+import bisect
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+
+MAGIC = b"SVYARC01"
+_PREAMBLE = struct.Struct("<8sQQ")
+STRING_BLOCK_ROWS = 4096
+ZLIB_LEVEL = 6
+_ALIGN = 8
+_NULL64 = -(2 ** 63)
+
+# kullanılan tip kodlarının genişliği platformdan bağımsız olmalı
+assert array("H").itemsize == 2 and array("I").itemsize == 4 and array("q").itemsize == 8
+
+
+def _int_typecode(span):
+    if span <= 0xFF:
+        return "B"
+    if span <= 0xFFFF:
+        return "H"
+    if span <= 0xFFFFFFFF:
+        return "I"
+    return "q"
+
+
+class _IntBuilder:
+    kind = "int"
+
+    def __init__(self):
+        self.values = array("q")
+        self.min = None
+        self.max = None
+
+    def append(self, value):
+        if value is None:
+            self.values.append(_NULL64)
+            return
+        value = int(value)
+        self.values.append(value)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def empty(self):
+        return self.min is None
+
+    def encode(self):
+        base = self.min - 1
+        typecode = _int_typecode(self.max - base)
+        if typecode == "q":
+            return {"typecode": "q", "base": None}, [self.values.tobytes()]
+        out = array(typecode, (0 if v == _NULL64 else v - base for v in self.values))
+        return {"typecode": typecode, "base": base}, [out.tobytes()]
+
+
+class _ChoiceBuilder:
+    kind = "choice"
+
+    def __init__(self, dictionary=()):
+        self.dictionary = []
+        self.codes_by_id = {}
+        for option_id in dictionary:
+            self._code(option_id)
+        self.counts = array("B")
+        self.codes = array("I")
+        self.multi = False
+
+    def _code(self, option_id):
+        code = self.codes_by_id.get(option_id)
+        if code is None:
+            self.dictionary.append(option_id)
+            code = self.codes_by_id[option_id] = len(self.dictionary)
+        return code
+
+    def append(self, option_ids):
+        option_ids = list(option_ids or ())[:255]
+        if len(option_ids) > 1:
+            self.multi = True
+        self.counts.append(len(option_ids))
+        self.codes.extend(self._code(int(o)) for o in option_ids)
+
+    def empty(self):
+        return not self.codes
+
+    def encode(self):
+        typecode = _int_typecode(len(self.dictionary))
+        meta = {"dictionary": self.dictionary, "typecode": typecode}
+        if not self.multi:
+            dense = array(typecode)
+            codes = iter(self.codes)
+            dense.extend(next(codes) if n else 0 for n in self.counts)
+            meta["layout"] = "single"
+            return meta, [dense.tobytes()]
+        meta["layout"] = "list"
+        meta["codes"] = len(self.codes)
+        return meta, [self.counts.tobytes(), array(typecode, self.codes).tobytes()]
+
+
+class _StringBuilder:
+    kind = "string"
+
+    def __init__(self):
+        self.blocks = []
+        self._pending = []
+        self.non_null = 0
+
+    def append(self, value):
+        if value:
+            self.non_null += 1
+        self._pending.append(value or "")
+        if len(self._pending) >= STRING_BLOCK_ROWS:
+            self._seal()
+
+    def _seal(self):
+        if not self._pending:
+            return
+        data = [s.encode("utf-8") for s in self._pending]
+        offsets = array("I", itertools.accumulate((len(d) for d in data), initial=0))
+        self.blocks.append(zlib.compress(offsets.tobytes() + b"".join(data), ZLIB_LEVEL))
+        self._pending = []
+
+    def empty(self):
+        return self.non_null == 0
+
+    def encode(self):
+        self._seal()
+        return {"block_rows": STRING_BLOCK_ROWS}, self.blocks
+
+
+_BUILDERS = {"int": _IntBuilder, "choice": _ChoiceBuilder, "string": _StringBuilder}
+
+
+class ArchiveWriter:
+    """
+    Satırları bellekteki kompakt kolon tamponlarında toplar; close() dosyayı önce geçici adla
+    yazar, fsync eder ve yerine taşır (yarım dosya hiçbir zaman asıl adla görünmez).
+    Hiç değeri olmayan kolonlar dosyaya yazılmaz (okurken hepsi NULL).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._columns = OrderedDict()
+
+    def column(self, name, kind, **options):
+        self._columns[name] = _BUILDERS[kind](**options)
+
+    def append(self, values):
+        for name, builder in self._columns.items():
+            builder.append(values.get(name))
+        self.rows += 1
+
+    def close(self, meta):
+        tmp = self.path + ".tmp"
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        columns = []
+        with open(tmp, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, 0, 0))
+            for name, builder in self._columns.items():
+                if builder.empty():
+                    continue
+                col_meta, parts = builder.encode()
+                segments = []
+                for part in parts:
+                    pad = -f.tell() % _ALIGN
+                    if pad:
+                        f.write(b"\0" * pad)
+                    segments.append([f.tell(), len(part)])
+                    f.write(part)
+                columns.append(dict(col_meta, name=name, kind=builder.kind, segments=segments))
+
+            header = zlib.compress(json.dumps({
+                "rows": self.rows,
+                "byteorder": sys.byteorder,
+                "columns": columns,
+                "meta": meta,
+            }, ensure_ascii=False, default=str).encode("utf-8"), ZLIB_LEVEL)
+            header_offset = f.tell()
+            f.write(header)
+            f.seek(0)
+            f.write(_PREAMBLE.pack(MAGIC, header_offset, len(header)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        return {"rows": self.rows, "columns": len(columns), "bytes": os.path.getsize(self.path)}
+
+
+class _IntColumn:
+    def __init__(self, reader, meta):
+        offset, length = meta["segments"][0]
+        self.typecode = meta["typecode"]
+        self.base = meta["base"]
+        self.values = reader._view(offset, length, self.typecode)
+
+    def get(self, i):
+        v = self.values[i]
+        if self.base is None:
+            return None if v == _NULL64 else v
+        return None if v == 0 else v + self.base
+
+
+class _ChoiceColumn:
+    def __init__(self, reader, meta):
+        self.dictionary = meta["dictionary"]
+        self.single = meta["layout"] == "single"
+        segments = meta["segments"]
+        if self.single:
+            self.codes = reader._view(segments[0][0], segments[0][1], meta["typecode"])
+        else:
+            self.counts = reader._view(segments[0][0], segments[0][1], "B")
+            self.codes = reader._view(segments[1][0], segments[1][1], meta["typecode"])
+            self._offsets = None
+            self._lock = threading.Lock()
+
+    def _starts(self):
+        # satır başlangıçları ilk çok-seçimli erişimde bir kez hesaplanır
+        if self._offsets is None:
+            with self._lock:
+                if self._offsets is None:
+                    self._offsets = array("I", itertools.accumulate(self.counts, initial=0))
+        return self._offsets
+
+    def get(self, i):
+        if self.single:
+            code = self.codes[i]
+            return [self.dictionary[code - 1]] if code else []
+        offsets = self._starts()
+        return [self.dictionary[c - 1] for c in self.codes[offsets[i]:offsets[i + 1]]]
+
+    def rows_with(self, option_id):
+        """option_id'yi içeren satır indeksleri."""
+        try:
+            code = self.dictionary.index(option_id) + 1
+        except ValueError:
+            return set()
+        if self.single:
+            return {i for i, c in enumerate(self.codes) if c == code}
+        offsets = self._starts()
+        return {i for i in range(len(self.counts)) if code in self.codes[offsets[i]:offsets[i + 1]]}
+
+
+class _StringColumn:
+    _CACHED_BLOCKS = 4
+
+    def __init__(self, reader, meta):
+        self.reader = reader
+        self.block_rows = meta["block_rows"]
+        self.segments = meta["segments"]
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _block(self, b):
+        with self._lock:
+            block = self._cache.get(b)
+            if block is not None:
+                self._cache.move_to_end(b)
+                return block
+        offset, length = self.segments[b]
+        raw = zlib.decompress(self.reader._mm[offset:offset + length])
+        rows = min(self.block_rows, self.reader.rows - b * self.block_rows)
+        offsets = array("I")
+        offsets.frombytes(raw[:4 * (rows + 1)])
+        if self.reader._swap:
+            offsets.byteswap()
+        block = (offsets, raw[4 * (rows + 1):])
+        with self._lock:
+            self._cache[b] = block
+            while len(self._cache) > self._CACHED_BLOCKS:
+                self._cache.popitem(last=False)
+        return block
+
+    def get(self, i):
+        offsets, data = self._block(i // self.block_rows)
+        j = i % self.block_rows
+        value = data[offsets[j]:offsets[j + 1]]
+        return value.decode("utf-8") if value else None
+
+    def rows_containing(self, needle):
+        """Büyük/küçük harf duyarsız alt dize eşleşen satır indeksleri (SQL LIKE %x%)."""
+        needle = needle.casefold()
+        matched = set()
+        for b in range(len(self.segments)):
+            offsets, data = self._block(b)
+            start = b * self.block_rows
+            for j in range(len(offsets) - 1):
+                value = data[offsets[j]:offsets[j + 1]]
+                if value and needle in value.decode("utf-8").casefold():
+                    matched.add(start + j)
+        return matched
+
+
+_COLUMNS = {"int": _IntColumn, "choice": _ChoiceColumn, "string": _StringColumn}
+
+
+class ArchiveReader:
+    """Dosyayı salt okunur mmap'ler; kolonlar ilk erişimde açılır ve önbelleğe alınır."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_offset, header_length = _PREAMBLE.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"arşiv dosyası değil: {path}")
+        header = json.loads(zlib.decompress(self._mm[header_offset:header_offset + header_length]))
+        self.rows = header["rows"]
+        self.meta = header["meta"]
+        self._swap = header["byteorder"] != sys.byteorder
+        self._specs = {c["name"]: c for c in header["columns"]}
+        self._columns = {}
+        self._lock = threading.Lock()
+
+    def _view(self, offset, length, typecode):
+        if self._swap:
+            values = array(typecode)
+            values.frombytes(self._mm[offset:offset + length])
+            values.byteswap()
+            return values
+        return memoryview(self._mm)[offset:offset + length].cast(typecode)
+
+    def column(self, name):
+        """Kolon nesnesi; dosyada yoksa (tüm değerleri NULL) None."""
+        column = self._columns.get(name)
+        if column is None and name in self._specs:
+            with self._lock:
+                column = self._columns.get(name)
+                if column is None:
+                    spec = self._specs[name]
+                    column = self._columns[name] = _COLUMNS[spec["kind"]](self, spec)
+        return column
+
+    def value(self, name, i):
+        column = self.column(name)
+        return column.get(i) if column is not None else None
+
+    def find(self, name, value):
+        """Tam sayı kolonunda value'nun ilk satır indeksi; yoksa None."""
+        column = self.column(name)
+        if column is None:
+            return None
+        target = value if column.base is None else value - column.base
+        if target <= 0 and column.base is not None:
+            return None
+        try:
+            needle = array(column.typecode, [target])
+        except OverflowError:
+            return None
+        if self._swap:
+            needle.byteswap()
+        needle = needle.tobytes()
+        offset, length = self._specs[name]["segments"][0]
+        width = len(needle)
+        pos = self._mm.find(needle, offset, offset + length)
+        while pos != -1:
+            if (pos - offset) % width == 0:
+                return (pos - offset) // width
+            pos = self._mm.find(needle, pos + 1, offset + length)
+        return None
+
+    def bisect(self, target, key):
+        """Satırlar key(i)'ye göre artan sıralıysa target'tan büyük ilk satırın indeksi."""
+        return bisect.bisect_right(range(self.rows), target, key=key)
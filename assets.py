@@ -0,0 +1,154 @@
+"""
+Statik dosya hattı: içerik hash'li dosya adları ve önceden sıkıştırma.
+
+    flask --app app assets-build    # static/ -> static/dist/ (hash'li adlar, .gz/.br, manifest.json)
+
+Üçüncü parti kütüphaneler ve font static/vendor altında repoya işlenmiştir (kaynak ve
+sürümler static/vendor/README.md'de); build yalnızca yerel dosyaları okur, ağa çıkmaz.
+Uygulama manifest.json'ı okuyup asset_url() ile hash'li adları üretir; dist yoksa
+static/ altındaki dosyalara düşer. VENDOR'daki bir dosya eksikse build ve uygulama
+açılışı hata verir.
+"""
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:  # opsiyonel: yoksa yalnızca .gz üretilir
+    brotli = None
+
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+HASH_LEN = 10
+COMPRESSIBLE_EXTS = {".css", ".js", ".json", ".svg", ".txt", ".map", ".ttf", ".eot"}
+MIN_COMPRESS_BYTES = 512
+
+# şablonların kullandığı vendor dosyaları (static/ altına göre) -> sürüm
+VENDOR = {
+    "vendor/bootstrap/bootstrap.min.css": "Bootstrap 4.6.2",
+    "vendor/bootstrap/bootstrap.min.js": "Bootstrap 4.6.2",
+    "vendor/bootstrap/popper.min.js": "Popper.js 1.16.1",
+    "vendor/jquery/jquery.slim.min.js": "jQuery 3.5.1 slim",
+    "vendor/chart.js/chart.umd.min.js": "Chart.js 4.4.0",
+    "vendor/fonts/poppins.css": "Poppins 4.004",
+    "vendor/fonts/poppins-light.woff2": "Poppins 4.004",
+    "vendor/fonts/poppins-regular.woff2": "Poppins 4.004",
+    "vendor/fonts/poppins-medium.woff2": "Poppins 4.004",
+    "vendor/fonts/poppins-semibold.woff2": "Poppins 4.004",
+}
+
+_CSS_URL_RE = re.compile(r"url\(\s*(['\"]?)([^'\")]+)\1\s*\)")
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def check_vendor(static_dir):
+    """VENDOR'daki dosyalardan biri static/ altında yoksa RuntimeError."""
+    missing = [name for name in VENDOR if not os.path.isfile(os.path.join(static_dir, name))]
+    if missing:
+        raise RuntimeError(f"vendor dosyaları eksik (static/vendor repoda olmalı): {', '.join(missing)}")
+
+
+def _hashed_name(name, data):
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LEN]
+    folder, base = posixpath.split(name)
+    stem, ext = posixpath.splitext(base)
+    return posixpath.join(folder, f"{stem}.{digest}{ext}")
+
+
+def _rewrite_css(name, css, manifest):
+    """CSS içindeki göreli url(...) referanslarını hash'li adlara çevirir."""
+    folder = posixpath.dirname(name)
+
+    def repl(m):
+        ref = m.group(2)
+        if ref.startswith(("data:", "http://", "https://", "//", "#")):
+            return m.group(0)
+        path, sep, suffix = ref.partition("?")
+        target = posixpath.normpath(posixpath.join(folder, path))
+        hashed = manifest.get(target)
+        if not hashed:
+            return m.group(0)
+        rel = posixpath.relpath(hashed, folder or ".")
+        return f"url({m.group(1)}{rel}{sep}{suffix}{m.group(1)})"
+
+    return _CSS_URL_RE.sub(repl, css)
+
+
+def _compress(path, data):
+    """Küçültüyorsa .gz (ve brotli kuruluysa .br) kardeş dosyalarını yazar; yazılan uzantılar."""
+    written = []
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        _write(path + ".gz", gz)
+        written.append(".gz")
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            _write(path + ".br", br)
+            written.append(".br")
+    return written
+
+
+def build(static_dir):
+    """
+    static/ altındaki dosyaları (dist hariç) static/dist/ altına hash'li adlarla kopyalar,
+    sıkıştırılabilir olanlar için .gz/.br üretir ve manifest.json yazar. Önce CSS dışı dosyalar
+    işlenir ki CSS'teki font/görsel referansları hash'li adlara çevrilebilsin.
+    Döner: {"files", "bytes", "compressed"}.
+    """
+    check_vendor(static_dir)
+    out_dir = os.path.join(static_dir, DIST_DIRNAME)
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+
+    names = []
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != out_dir)
+        for fname in sorted(files):
+            if fname.startswith("."):
+                continue
+            rel = os.path.relpath(os.path.join(root, fname), static_dir)
+            names.append(rel.replace(os.sep, "/"))
+    names.sort(key=lambda n: (n.endswith(".css"), n))
+
+    manifest = {}
+    stats = {"files": 0, "bytes": 0, "compressed": 0}
+    for name in names:
+        with open(os.path.join(static_dir, name), "rb") as f:
+            data = f.read()
+        if name.endswith(".css"):
+            data = _rewrite_css(name, data.decode("utf-8"), manifest).encode("utf-8")
+
+        hashed = _hashed_name(name, data)
+        out_path = os.path.join(out_dir, hashed)
+        _write(out_path, data)
+        manifest[name] = hashed
+
+        stats["files"] += 1
+        stats["bytes"] += len(data)
+        if posixpath.splitext(name)[1] in COMPRESSIBLE_EXTS and len(data) >= MIN_COMPRESS_BYTES:
+            if _compress(out_path, data):
+                stats["compressed"] += 1
+
+    _write(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    return stats
+
+
+def load_manifest(static_dir):
+    """static/dist/manifest.json; build çalıştırılmamışsa boş sözlük."""
+    path = os.path.join(static_dir, DIST_DIRNAME, MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
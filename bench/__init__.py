@@ -0,0 +1,14 @@
+"""
+Uçtan uca benchmark araçları.
+
+    python -m bench seed --participants 200000 --manifest bench-seed.json
+    python -m bench run --manifest bench-seed.json --url http://localhost:5000 --out report.json
+    python -m bench compare eski.json yeni.json
+
+seed: sentetik anketleri doğrudan MySQL'e toplu yazar (uygulamanın MYSQL_* ayarlarıyla),
+sayaçları yeniden kurar ve yük sürücüsünün kullanacağı manifest'i yazar.
+run: take_survey POST (form + XHR) ve analytics / results / list_surveys GET'lerini
+verilen eşzamanlılık seviyelerinde çalıştırır; throughput ve p50/p95/p99 gecikmeyi JSON
+rapor olarak yazar. --embedded ile uygulama aynı process'te başlatılır.
+compare: iki raporu senaryo + eşzamanlılık bazında karşılaştırır.
+"""
@@ -0,0 +1,187 @@
+import argparse
+import os
+import sys
+import threading
+
+from . import load
+
+
+def _levels(value):
+    try:
+        levels = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("virgülle ayrılmış tam sayılar bekleniyor, ör. 1,8,32")
+    if not levels or min(levels) < 1:
+        raise argparse.ArgumentTypeError("eşzamanlılık en az 1 olmalı")
+    return levels
+
+
+def _scenarios(value):
+    names = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [n for n in names if n not in load.SCENARIOS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"bilinmeyen senaryo: {', '.join(unknown)} (seçenekler: {', '.join(load.SCENARIOS)})")
+    return names
+
+
+def cmd_seed(args):
+    # app import'u MYSQL_* ortam değişkenleriyle havuzu kurar
+    import app as survey_app
+    import schema
+    from . import seed
+
+    def progress(survey_id, n):
+        print(f"  anket {survey_id}: {n} katılımcı", file=sys.stderr)
+
+    with survey_app.db_pool.connection() as conn:
+        schema.apply_migrations(conn)
+        manifest = seed.seed(
+            conn,
+            surveys=args.surveys,
+            participants=args.participants,
+            questions_per_type=args.questions_per_type,
+            fields=args.fields,
+            rating_max=args.rating_max,
+            options_per_question=args.options,
+            text_ratio=args.text_ratio,
+            batch_size=args.batch_size,
+            random_seed=args.random_seed,
+            progress=progress,
+        )
+        for survey in manifest["surveys"]:
+            survey_app.rebuild_answer_counters(conn, survey["id"])
+            survey_app.rebuild_text_index(conn, survey["id"])
+            with conn.cursor() as cur:
+                survey_app.bump_data_version(cur, survey["id"])
+            conn.commit()
+
+    load.write_json(args.manifest, manifest)
+    print(f"{len(manifest['surveys'])} anket, {manifest['rows']['answers']} cevap satırı "
+          f"{manifest['elapsed_s']} sn'de yazıldı -> {args.manifest}")
+
+
+def _start_embedded():
+    """Uygulamayı aynı process'te thread'li werkzeug sunucusuyla, boş bir portta başlatır."""
+    from werkzeug.serving import make_server
+    import app as survey_app
+
+    server = make_server("127.0.0.1", 0, survey_app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def cmd_run(args):
+    manifest = load.read_json(args.manifest)
+    if args.survey_id:
+        manifest["surveys"] = [s for s in manifest["surveys"] if s["id"] in args.survey_id]
+
+    server = None
+    if args.embedded:
+        server, base_url = _start_embedded()
+        target = "embedded"
+    else:
+        base_url, target = args.url, "url"
+
+    def progress(cell):
+        lat = cell["latency_ms"]
+        print(
+            f"{cell['scenario']:<13} c={cell['concurrency']:<4} {cell['throughput_rps'] or 0:>9.1f} rps  "
+            f"p50={lat['p50']}ms p95={lat['p95']}ms p99={lat['p99']}ms  hata={cell['errors']}",
+            file=sys.stderr,
+        )
+
+    try:
+        report = load.run(
+            base_url, manifest, args.scenarios, args.concurrency,
+            requests=None if args.duration else args.requests,
+            duration=args.duration,
+            warmup=args.warmup,
+            admin_user=args.admin_user,
+            admin_password=args.admin_password,
+            accept_encoding=args.accept_encoding,
+            random_seed=args.random_seed,
+            target=target,
+            progress=progress,
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    if args.label:
+        report["meta"]["label"] = args.label
+    load.write_json(args.out, report)
+    print(f"rapor -> {args.out}")
+
+
+def cmd_compare(args):
+    old, new = load.read_json(args.old), load.read_json(args.new)
+    rows = load.compare(old, new, metric=args.metric)
+    m = args.metric
+    print(f"{'senaryo':<13} {'c':>4} {'rps eski':>10} {'rps yeni':>10} {'Δ%':>7} {m + ' eski':>10} {m + ' yeni':>10} {'Δ%':>7}")
+    regressions = 0
+    for r in rows:
+        fmt = lambda v: "-" if v is None else str(v)
+        print(
+            f"{r['scenario']:<13} {r['concurrency']:>4} {fmt(r['rps_old']):>10} {fmt(r['rps_new']):>10} "
+            f"{fmt(r['rps_change_pct']):>7} {fmt(r[m + '_old']):>10} {fmt(r[m + '_new']):>10} {fmt(r[m + '_change_pct']):>7}"
+        )
+        if args.fail_over is not None:
+            slower = r[m + "_change_pct"] is not None and r[m + "_change_pct"] > args.fail_over
+            fewer = r["rps_change_pct"] is not None and -r["rps_change_pct"] > args.fail_over
+            if slower or fewer:
+                regressions += 1
+    if regressions:
+        print(f"{regressions} hücrede %{args.fail_over} üzeri gerileme", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Anket uygulaması benchmark araçları")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("seed", help="sentetik anket verisi üret (MYSQL_* ortam değişkenlerindeki veritabanına)")
+    p.add_argument("--surveys", type=int, default=1)
+    p.add_argument("--participants", type=int, default=10000, help="anket başına katılımcı")
+    p.add_argument("--questions-per-type", type=int, default=3, help="her soru tipinden soru sayısı")
+    p.add_argument("--fields", type=int, default=4, help="katılımcı alanı sayısı")
+    p.add_argument("--options", type=int, default=5, help="seçmeli soru başına seçenek")
+    p.add_argument("--rating-max", type=int, default=5, choices=range(2, 11), metavar="2..10")
+    p.add_argument("--text-ratio", type=float, default=0.6, help="açık uçlu sorulara cevap verme oranı")
+    p.add_argument("--batch-size", type=int, default=5000)
+    p.add_argument("--random-seed", type=int, default=42)
+    p.add_argument("--manifest", default="bench-seed.json")
+    p.set_defaults(func=cmd_seed)
+
+    p = sub.add_parser("run", help="yük testi çalıştır ve JSON rapor yaz")
+    target = p.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://127.0.0.1:5000", help="çalışan uygulamanın adresi")
+    target.add_argument("--embedded", action="store_true", help="uygulamayı bu process'te başlat")
+    p.add_argument("--manifest", default="bench-seed.json")
+    p.add_argument("--survey-id", type=int, action="append", help="yalnızca bu anket(ler)i kullan")
+    p.add_argument("--scenarios", type=_scenarios, default=list(load.SCENARIOS))
+    p.add_argument("--concurrency", type=_levels, default=[1, 8, 32])
+    p.add_argument("--requests", type=int, default=500, help="hücre başına istek sayısı")
+    p.add_argument("--duration", type=float, help="istek sayısı yerine hücre başına saniye")
+    p.add_argument("--warmup", type=int, default=20, help="hücre başına ölçülmeyen istek")
+    p.add_argument("--accept-encoding", default="gzip", help="boş bırakılırsa sıkıştırma istenmez")
+    p.add_argument("--admin-user", default=os.environ.get("ADMIN_USERNAME"))
+    p.add_argument("--admin-password", default=os.environ.get("ADMIN_PASSWORD"))
+    p.add_argument("--random-seed", type=int, default=1)
+    p.add_argument("--label", help="rapora eklenecek serbest etiket (ör. sürüm)")
+    p.add_argument("--out", default="bench-report.json")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("compare", help="iki raporu karşılaştır")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--metric", default="p95", choices=["mean", "p50", "p95", "p99", "max"])
+    p.add_argument("--fail-over", type=float, help="bu yüzdeden büyük gerilemede çıkış kodu 1")
+    p.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+HTTP yük sürücüsü (yalnızca stdlib). Her worker thread kendi keep-alive bağlantısını
+(http.client) kullanır; admin senaryoları için oturum çerezi bir kez login olunarak alınır
+ve tüm thread'lerde paylaşılır (Flask oturumu imzalı çerezde tutulur).
+"""
+import http.client
+import json
+import os
+import platform
+import random
+import subprocess
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+SCENARIOS = ["take_form", "take_xhr", "analytics", "show_results", "list_surveys"]
+ADMIN_SCENARIOS = {"analytics", "show_results", "list_surveys"}
+REPORT_VERSION = 1
+
+
+def percentile(sorted_values, p):
+    """Doğrusal interpolasyonlu yüzdelik; sorted_values artan sıralı olmalı."""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(latencies, errors, elapsed, statuses):
+    values = sorted(latencies)
+    ms = lambda v: None if v is None else round(v * 1000, 2)
+    return {
+        "requests": len(values) + errors,
+        "errors": errors,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed > 0 else None,
+        "latency_ms": {
+            "mean": ms(sum(values) / len(values)) if values else None,
+            "p50": ms(percentile(values, 50)),
+            "p95": ms(percentile(values, 95)),
+            "p99": ms(percentile(values, 99)),
+            "max": ms(values[-1]) if values else None,
+        },
+    }
+
+
+class Client:
+    """Tek bağlantılı, keep-alive HTTP istemcisi; bağlantı koparsa bir kez yeniden dener."""
+
+    def __init__(self, base_url, timeout=60):
+        parts = urllib.parse.urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.conn = None
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        self.conn = cls(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method, path, body=None, headers=None):
+        """Döner: (status, headers, body_bytes). Gövde tamamen okunur (gecikmeye dahil)."""
+        for attempt in (0, 1):
+            if self.conn is None:
+                self._connect()
+            try:
+                self.conn.request(method, self.prefix + path, body=body, headers=headers or {})
+                resp = self.conn.getresponse()
+                data = resp.read()
+                if resp.getheader("Connection", "").lower() == "close":
+                    self.close()
+                return resp.status, resp.getheaders(), data
+            except (http.client.HTTPException, OSError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def admin_cookie(base_url, username, password):
+    client = Client(base_url)
+    try:
+        body = urllib.parse.urlencode({"username": username, "password": password})
+        status, headers, _ = client.request("POST", "/admin/login", body, {
+            "Content-Type": "application/x-www-form-urlencoded",
+        })
+    finally:
+        client.close()
+    cookies = [v.split(";", 1)[0] for k, v in headers if k.lower() == "set-cookie"]
+    if status != 302 or not cookies:
+        raise RuntimeError(f"admin girişi başarısız (HTTP {status}); ADMIN_USERNAME / ADMIN_PASSWORD kontrol edin")
+    return "; ".join(cookies)
+
+
+def submission_form(rng, survey):
+    """Manifest'teki tanımdan parse_submission'ın kabul edeceği rastgele bir form üretir."""
+    form = []
+    for f in survey["fields"]:
+        if f["type"] == "text":
+            if f["required"] or rng.random() < 0.7:
+                form.append((f"pf_text_{f['id']}", f"bench{rng.randint(1, 10**6)}@example.com"))
+        elif f["type"] == "single_choice":
+            form.append((f"pf_{f['id']}", rng.choice(f["options"])))
+        else:
+            for opt in rng.sample(f["options"], rng.randint(1, min(2, len(f["options"])))):
+                form.append((f"pf_{f['id']}", opt))
+
+    for q in survey["questions"]:
+        qid = q["id"]
+        if q["type"] == "text":
+            if q["required"] or rng.random() < 0.6:
+                form.append((f"question_text_{qid}", "yük testi cevabı %d" % rng.randint(1, 1000)))
+        elif q["type"] == "rating":
+            form.append((f"question_{qid}", rng.randint(q["rating_min"], q["rating_max"])))
+        elif q["type"] == "single_choice":
+            opt = rng.choice(q["options"])
+            form.append((f"question_{qid}", opt))
+            if opt == q["other_option"]:
+                form.append((f"other_{qid}", "diğer"))
+        else:
+            for opt in rng.sample(q["options"], rng.randint(1, min(3, len(q["options"])))):
+                form.append((f"question_{qid}", opt))
+
+    form.append(("duration_seconds", rng.randint(30, 900)))
+    return urllib.parse.urlencode(form)
+
+
+def build_request(scenario, rng, survey, cookie, accept_encoding):
+    """Döner: (method, path, body, headers, beklenen_status)"""
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    sid = survey["id"]
+    if scenario in ADMIN_SCENARIOS:
+        headers["Cookie"] = cookie
+    if scenario == "take_form":
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return "POST", f"/surveys/{sid}/take", submission_form(rng, survey), headers, 302
+    if scenario == "take_xhr":
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+        headers["X-Requested-With"] = "XMLHttpRequest"
+        return "POST", f"/surveys/{sid}/take", submission_form(rng, survey), headers, 200
+    if scenario == "analytics":
+        return "GET", f"/analytics?survey_id={sid}", None, headers, 200
+    if scenario == "show_results":
+        return "GET", f"/surveys/{sid}/results", None, headers, 200
+    if scenario == "list_surveys":
+        return "GET", "/surveys", None, headers, 200
+    raise ValueError(f"bilinmeyen senaryo: {scenario}")
+
+
+def run_level(base_url, scenario, concurrency, surveys, cookie, requests=None, duration=None,
+              warmup=0, accept_encoding="gzip", random_seed=1):
+    """
+    Tek (senaryo, eşzamanlılık) hücresini çalıştırır. requests verilirse toplam istek sayısı,
+    yoksa duration saniye boyunca çalışılır. Warmup istekleri ölçüme katılmaz.
+    """
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+    state = {"remaining": requests, "errors": 0}
+    deadline = [None]
+
+    def take_ticket():
+        with lock:
+            if state["remaining"] is not None:
+                if state["remaining"] <= 0:
+                    return False
+                state["remaining"] -= 1
+                return True
+        return time.perf_counter() < deadline[0]
+
+    def worker(index):
+        rng = random.Random(random_seed * 1000 + index)
+        client = Client(base_url)
+        local, local_status, local_errors = [], {}, 0
+        try:
+            for _ in range(warmup // concurrency + (1 if index < warmup % concurrency else 0)):
+                method, path, body, headers, _expected = build_request(scenario, rng, rng.choice(surveys), cookie, accept_encoding)
+                try:
+                    client.request(method, path, body, headers)
+                except (http.client.HTTPException, OSError):
+                    pass
+            start_barrier.wait()
+            while take_ticket():
+                method, path, body, headers, expected = build_request(scenario, rng, rng.choice(surveys), cookie, accept_encoding)
+                t0 = time.perf_counter()
+                try:
+                    status, _, _ = client.request(method, path, body, headers)
+                except (http.client.HTTPException, OSError):
+                    local_errors += 1
+                    local_status["conn_error"] = local_status.get("conn_error", 0) + 1
+                    continue
+                elapsed = time.perf_counter() - t0
+                local_status[status] = local_status.get(status, 0) + 1
+                if status == expected:
+                    local.append(elapsed)
+                else:
+                    local_errors += 1
+        finally:
+            client.close()
+        with lock:
+            latencies.extend(local)
+            state["errors"] += local_errors
+            for k, v in local_status.items():
+                statuses[k] = statuses.get(k, 0) + v
+
+    # tüm thread'ler warmup'ı bitirip aynı anda başlasın; saat son thread bariyeri geçince başlar
+    started = [None]
+
+    def start_clock():
+        started[0] = time.perf_counter()
+        if duration is not None:
+            deadline[0] = started[0] + duration
+
+    start_barrier = threading.Barrier(concurrency, action=start_clock)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started[0]
+
+    result = {"scenario": scenario, "concurrency": concurrency}
+    result.update(summarize(latencies, state["errors"], elapsed, statuses))
+    return result
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(base_url, manifest, scenarios, levels, requests=None, duration=None, warmup=0,
+        admin_user=None, admin_password=None, accept_encoding="gzip", random_seed=1,
+        target="url", progress=None):
+    """Tüm senaryo × eşzamanlılık hücrelerini sırayla çalıştırır ve rapor sözlüğü döner."""
+    surveys = manifest["surveys"]
+    if not surveys:
+        raise ValueError("manifest'te anket yok")
+    cookie = None
+    if ADMIN_SCENARIOS.intersection(scenarios):
+        cookie = admin_cookie(base_url, admin_user, admin_password)
+
+    results = []
+    for concurrency in levels:
+        for scenario in scenarios:
+            cell = run_level(
+                base_url, scenario, concurrency, surveys, cookie,
+                requests=requests, duration=duration, warmup=warmup,
+                accept_encoding=accept_encoding, random_seed=random_seed,
+            )
+            results.append(cell)
+            if progress:
+                progress(cell)
+
+    return {
+        "version": REPORT_VERSION,
+        "meta": {
+            "git_commit": _git_commit(),
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "target": target,
+            "base_url": base_url,
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "cpu_count": os.cpu_count(),
+        },
+        "params": {
+            "scenarios": list(scenarios),
+            "levels": list(levels),
+            "requests": requests,
+            "duration_s": duration,
+            "warmup": warmup,
+            "accept_encoding": accept_encoding,
+            "random_seed": random_seed,
+            "seed": manifest.get("params"),
+            "survey_ids": [s["id"] for s in surveys],
+        },
+        "results": results,
+    }
+
+
+def compare(old, new, metric="p95"):
+    """
+    İki raporu (senaryo, eşzamanlılık) bazında eşler. Döner: satır listesi
+    {"scenario", "concurrency", "rps_old", "rps_new", "rps_change_pct", "<metric>_old", ...}
+    """
+    def index(report):
+        return {(r["scenario"], r["concurrency"]): r for r in report["results"]}
+
+    def change(a, b):
+        if a in (None, 0) or b is None:
+            return None
+        return round((b - a) * 100.0 / a, 1)
+
+    old_cells, new_cells = index(old), index(new)
+    rows = []
+    for key in sorted(set(old_cells) & set(new_cells), key=lambda k: (SCENARIOS.index(k[0]) if k[0] in SCENARIOS else 99, k[1])):
+        a, b = old_cells[key], new_cells[key]
+        la, lb = a["latency_ms"].get(metric), b["latency_ms"].get(metric)
+        rows.append({
+            "scenario": key[0],
+            "concurrency": key[1],
+            "rps_old": a["throughput_rps"],
+            "rps_new": b["throughput_rps"],
+            "rps_change_pct": change(a["throughput_rps"], b["throughput_rps"]),
+            f"{metric}_old": la,
+            f"{metric}_new": lb,
+            f"{metric}_change_pct": change(la, lb),
+            "errors_old": a["errors"],
+            "errors_new": b["errors"],
+        })
+    return rows
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,227 @@
+"""
+Sentetik anket verisi üreticisi. Tüm soru tipleri (single_choice, multiple_choice, rating,
+text) ve participant_fields üretir; participants / responses / answers satırları açık id'lerle
+çok-satırlı INSERT'lerle (executemany) partiler halinde yazılır. Açık id'ler MAX(id)+1'den
+başladığı için seed sırasında tabloya başka yazan olmamalıdır.
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+WORDS = [
+    "hizmet", "hızlı", "güzel", "yavaş", "fiyat", "kalite", "personel", "temiz", "öneri",
+    "uygulama", "memnun", "sorun", "destek", "teslimat", "ürün", "arayüz", "kolay", "pahalı",
+    "ulaşım", "etkinlik", "konuşmacı", "salon", "yemek", "süre", "organizasyon", "tekrar",
+]
+FIRST_NAMES = ["Ayşe", "Mehmet", "Zeynep", "Ali", "Elif", "Can", "Deniz", "Ece", "Emre", "Selin"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan"]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Eskişehir", "Trabzon"]
+
+FIELD_TEMPLATES = [
+    ("Yaş Grubu", "single_choice", ["18-24", "25-34", "35-44", "45-54", "55+"]),
+    ("Şehir", "text", None),
+    ("Diller", "multiple_choice", ["Türkçe", "İngilizce", "Almanca", "Fransızca"]),
+    ("Departman", "single_choice", ["Satış", "Pazarlama", "Yazılım", "İK", "Finans", "Destek"]),
+    ("E-mail", "text", None),
+]
+QUESTION_TYPES = ["single_choice", "multiple_choice", "rating", "text"]
+
+
+def _next_id(cur, table):
+    cur.execute(f"SELECT COALESCE(MAX(id), 0) AS m FROM {table}")
+    return int(cur.fetchone()["m"]) + 1
+
+
+def _sentence(rng, lo=3, hi=12):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+class _BatchWriter:
+    """Tablo başına satır tamponu; batch_size'a ulaşınca executemany + commit."""
+
+    SQL = {
+        "participants": "INSERT INTO participants (id, survey_id, first_name, last_name, email, duration_seconds, created_at) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        "responses": "INSERT INTO responses (id, survey_id, participant_id, created_at) VALUES (%s, %s, %s, %s)",
+        "participant_answers": "INSERT INTO participant_answers (participant_id, field_id, option_id, answer_text) VALUES (%s, %s, %s, %s)",
+        "answers": "INSERT INTO answers (response_id, question_id, option_id, answer_text, answer_number) VALUES (%s, %s, %s, %s, %s)",
+    }
+    # FK'ler açıksa ebeveyn tablolar önce yazılmalı
+    ORDER = ["participants", "responses", "participant_answers", "answers"]
+
+    def __init__(self, conn, batch_size):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.rows = {t: [] for t in self.ORDER}
+        self.counts = {t: 0 for t in self.ORDER}
+
+    def add(self, table, row):
+        self.rows[table].append(row)
+        if len(self.rows[table]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        with self.conn.cursor() as cur:
+            for table in self.ORDER:
+                rows = self.rows[table]
+                if rows:
+                    cur.executemany(self.SQL[table], rows)
+                    self.counts[table] += len(rows)
+                    self.rows[table] = []
+        self.conn.commit()
+
+
+def _create_definition(cur, rng, index, questions_per_type, fields, rating_max, options_per_question):
+    cur.execute(
+        "INSERT INTO surveys (title, description) VALUES (%s, %s)",
+        (f"Benchmark anketi #{index}", "python -m bench seed ile üretildi")
+    )
+    survey_id = cur.lastrowid
+
+    field_defs = []
+    for i in range(fields):
+        label, ftype, options = FIELD_TEMPLATES[i % len(FIELD_TEMPLATES)]
+        if i >= len(FIELD_TEMPLATES):
+            label = f"{label} {i // len(FIELD_TEMPLATES) + 1}"
+        cur.execute(
+            """
+            INSERT INTO participant_fields (survey_id, field_label, field_type, is_required, sort_order)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            (survey_id, label, ftype, 1 if i == 0 else 0, i)
+        )
+        field = {"id": cur.lastrowid, "type": ftype, "label": label, "required": i == 0, "options": []}
+        for j, text in enumerate(options or []):
+            cur.execute(
+                "INSERT INTO participant_field_options (field_id, option_text, sort_order) VALUES (%s, %s, %s)",
+                (field["id"], text, j)
+            )
+            field["options"].append(cur.lastrowid)
+        field_defs.append(field)
+
+    question_defs = []
+    for n in range(questions_per_type):
+        for qtype in QUESTION_TYPES:
+            cur.execute(
+                """
+                INSERT INTO questions (survey_id, question_text, question_type, is_required, rating_min, rating_max)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    survey_id,
+                    f"{qtype} sorusu {n + 1}: {_sentence(rng, 3, 6)}?",
+                    qtype,
+                    1 if qtype != "text" else 0,
+                    1 if qtype == "rating" else None,
+                    rating_max if qtype == "rating" else None,
+                )
+            )
+            question = {
+                "id": cur.lastrowid, "type": qtype, "required": qtype != "text",
+                "options": [], "other_option": None,
+                "rating_min": 1, "rating_max": rating_max,
+            }
+            if qtype in ("single_choice", "multiple_choice"):
+                for k in range(options_per_question):
+                    is_other = 1 if (qtype == "single_choice" and k == options_per_question - 1) else 0
+                    cur.execute(
+                        "INSERT INTO options (question_id, option_text, is_other) VALUES (%s, %s, %s)",
+                        (question["id"], "Diğer" if is_other else f"Seçenek {k + 1}", is_other)
+                    )
+                    question["options"].append(cur.lastrowid)
+                    if is_other:
+                        question["other_option"] = cur.lastrowid
+            question_defs.append(question)
+
+    return survey_id, field_defs, question_defs
+
+
+def _participant_rows(rng, field_defs):
+    rows = []
+    for f in field_defs:
+        if f["type"] == "text":
+            if f["required"] or rng.random() < 0.7:
+                value = rng.choice(CITIES) if f["label"].startswith("Şehir") else f"kisi{rng.randint(1, 10**6)}@example.com"
+                rows.append((f["id"], None, value))
+        elif f["type"] == "single_choice":
+            if f["required"] or rng.random() < 0.9:
+                rows.append((f["id"], rng.choice(f["options"]), None))
+        else:
+            for opt in rng.sample(f["options"], rng.randint(1, min(2, len(f["options"])))):
+                rows.append((f["id"], opt, None))
+    return rows
+
+
+def _answer_rows(rng, question_defs, text_ratio):
+    rows = []
+    for q in question_defs:
+        if q["type"] == "single_choice":
+            opt = rng.choice(q["options"])
+            rows.append((q["id"], opt, _sentence(rng, 1, 4) if opt == q["other_option"] else None, None))
+        elif q["type"] == "multiple_choice":
+            for opt in rng.sample(q["options"], rng.randint(1, min(3, len(q["options"])))):
+                rows.append((q["id"], opt, None, None))
+        elif q["type"] == "rating":
+            rows.append((q["id"], None, None, min(q["rating_max"], max(1, int(rng.triangular(1, q["rating_max"] + 1, q["rating_max"] * 0.7))))))
+        elif rng.random() < text_ratio:
+            rows.append((q["id"], None, _sentence(rng), None))
+    return rows
+
+
+def seed(conn, surveys=1, participants=1000, questions_per_type=2, fields=3, rating_max=5,
+         options_per_question=5, text_ratio=0.6, batch_size=5000, random_seed=42,
+         days=30, progress=None):
+    """
+    Anketleri üretir ve manifest döner:
+    {"params", "elapsed_s", "rows", "surveys": [{"id", "participants", "fields", "questions"}]}
+    Sayaç tabloları ve kelime indeksi sonda çağıranın yeniden kurması için survey id'leri döner.
+    """
+    rng = random.Random(random_seed)
+    started = time.perf_counter()
+    writer = _BatchWriter(conn, batch_size)
+    manifest = {
+        "params": {
+            "surveys": surveys, "participants": participants, "questions_per_type": questions_per_type,
+            "fields": fields, "rating_max": rating_max, "options_per_question": options_per_question,
+            "text_ratio": text_ratio, "random_seed": random_seed,
+        },
+        "surveys": [],
+    }
+
+    for index in range(1, surveys + 1):
+        with conn.cursor() as cur:
+            survey_id, field_defs, question_defs = _create_definition(
+                cur, rng, index, questions_per_type, fields, rating_max, options_per_question
+            )
+            conn.commit()
+            next_pid = _next_id(cur, "participants")
+            next_rid = _next_id(cur, "responses")
+
+        start_ts = datetime.now().replace(microsecond=0) - timedelta(days=days)
+        step = timedelta(days=days) / max(participants, 1)
+        for n in range(participants):
+            pid = next_pid + n
+            rid = next_rid + n
+            ts = start_ts + step * n
+            writer.add("participants", (
+                pid, survey_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), None,
+                rng.randint(30, 900), ts,
+            ))
+            writer.add("responses", (rid, survey_id, pid, ts))
+            for row in _participant_rows(rng, field_defs):
+                writer.add("participant_answers", (pid, *row))
+            for row in _answer_rows(rng, question_defs, text_ratio):
+                writer.add("answers", (rid, *row))
+            if progress and (n + 1) % 10000 == 0:
+                progress(survey_id, n + 1)
+
+        writer.flush()
+        manifest["surveys"].append({
+            "id": survey_id,
+            "participants": participants,
+            "fields": field_defs,
+            "questions": question_defs,
+        })
+
+    manifest["rows"] = writer.counts
+    manifest["elapsed_s"] = round(time.perf_counter() - started, 2)
+    return manifest
@@ -0,0 +1,243 @@
+"""
+İçerik pazarlığıyla (Accept-Encoding) gzip / brotli sıkıştıran WSGI middleware'i.
+
+- Akış yanıtlarını (generator export'lar) parça parça sıkıştırır; satır satır gelen küçük
+  parçalar oranı bozmasın diye her flush_bytes'lık girdiden sonra sync flush yapılır,
+  istemci veriyi üretildikçe alır.
+- Content-Length min_size'dan küçükse ya da gövde min_size'a ulaşmadan biterse dokunmaz.
+- Zaten Content-Encoding taşıyan (ör. önceden sıkıştırılmış /assets), sıkıştırılamaz
+  tipteki, no-transform ya da SSE yanıtlarına dokunmaz.
+- Sıkıştırılabilir tipteki her yanıta, bu istekte sıkıştırılmasa da (istemci kabul etmiyor,
+  gövde min_size altında) "Vary: Accept-Encoding" eklenir; ara cache'ler sıkıştırılmamış
+  kopyayı gzip / br isteyen istemcilere (ya da tersini) sunmasın.
+"""
+import zlib
+
+try:
+    import brotli
+except ImportError:  # opsiyonel: yoksa yalnızca gzip
+    brotli = None
+
+COMPRESSIBLE_TYPES = {
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/csv",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def parse_accept_encoding(header):
+    """'gzip;q=0.8, br' -> {'gzip': 0.8, 'br': 1.0}"""
+    prefs = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        prefs[name] = q
+    return prefs
+
+
+def choose_encoding(header, available):
+    """available sırası eşitlikte tercih sırasıdır; uygun kodlama yoksa None."""
+    prefs = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for name in available:
+        q = prefs.get(name, prefs.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def add_vary(headers, value="Accept-Encoding"):
+    """Vary başlıklarını tek satırda birleştirir; value yoksa ekler."""
+    out, vary = [], []
+    for key, v in headers:
+        if key.lower() == "vary":
+            vary.extend(item.strip() for item in v.split(",") if item.strip())
+        else:
+            out.append((key, v))
+    if value.lower() not in {item.lower() for item in vary}:
+        vary.append(value)
+    out.append(("Vary", ", ".join(vary)))
+    return out
+
+
+class _Compressor:
+    def __init__(self, encoding, level, brotli_quality):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._z = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data, flush=False):
+        """flush=True ise o ana kadarki tüm girdinin çıktısı döner (sync flush)."""
+        if self.encoding == "br":
+            out = self._br.process(data)
+            return out + self._br.flush() if flush else out
+        out = self._z.compress(data)
+        return out + self._z.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self):
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._z.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, min_size=1024, level=6, brotli_quality=5, flush_bytes=16384, mimetypes=None):
+        self.app = app
+        self.min_size = max(0, int(min_size))
+        self.flush_bytes = max(1, int(flush_bytes))
+        self.level = max(1, min(int(level), 9))
+        self.brotli_quality = max(0, min(int(brotli_quality), 11))
+        self.mimetypes = set(mimetypes or COMPRESSIBLE_TYPES)
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def __call__(self, environ, start_response):
+        encoding = None
+        if environ.get("REQUEST_METHOD") != "HEAD":
+            encoding = choose_encoding(environ.get("HTTP_ACCEPT_ENCODING"), self.encodings)
+        if encoding is None:
+            def vary_start_response(status, headers, exc_info=None):
+                if self.varies(headers):
+                    headers = add_vary(headers)
+                return start_response(status, headers, exc_info)
+
+            return self.app(environ, vary_start_response)
+
+        captured = {}
+
+        def capture(status, headers, exc_info=None):
+            captured["status"] = status
+            captured["headers"] = headers
+            captured["exc_info"] = exc_info
+            return captured.setdefault("written", []).append
+
+        app_iter = self.app(environ, capture)
+        return _CompressedBody(self, app_iter, captured, start_response, encoding)
+
+    def varies(self, headers):
+        """Gösterimi Accept-Encoding'e göre değişebilecek yanıt: sıkıştırılabilir tip, no-transform yok."""
+        h = {k.lower(): v for k, v in headers}
+        if "no-transform" in h.get("cache-control", "").lower():
+            return False
+        return h.get("content-type", "").split(";", 1)[0].strip().lower() in self.mimetypes
+
+    def should_compress(self, status, headers):
+        code = int(status.split(" ", 1)[0])
+        if code < 200 or code in (204, 206, 304):
+            return False
+        h = {k.lower(): v for k, v in headers}
+        if "content-encoding" in h:
+            return False
+        if "no-transform" in h.get("cache-control", "").lower():
+            return False
+        mimetype = h.get("content-type", "").split(";", 1)[0].strip().lower()
+        if mimetype not in self.mimetypes:
+            return False
+        length = h.get("content-length")
+        if length is not None and length.isdigit() and int(length) < self.min_size:
+            return False
+        return True
+
+
+class _CompressedBody:
+    """close()'u upstream'e iletmek için generator yerine sınıf (WSGI iterable)."""
+
+    def __init__(self, middleware, app_iter, captured, start_response, encoding):
+        self.mw = middleware
+        self.app_iter = app_iter
+        self.captured = captured
+        self.start_response = start_response
+        self.encoding = encoding
+
+    def close(self):
+        close = getattr(self.app_iter, "close", None)
+        if close is not None:
+            close()
+
+    def __iter__(self):
+        chunks = iter(self.app_iter)
+        buffered = list(self.captured.pop("written", []))
+
+        # start_response ilk parçaya kadar ertelenmiş olabilir
+        exhausted = False
+        while "status" not in self.captured:
+            try:
+                buffered.append(next(chunks))
+            except StopIteration:
+                exhausted = True
+                break
+
+        status = self.captured["status"]
+        headers = list(self.captured["headers"])
+        exc_info = self.captured["exc_info"]
+
+        if self.mw.varies(headers):
+            headers = add_vary(headers)
+
+        if not self.mw.should_compress(status, headers):
+            self.start_response(status, headers, exc_info)
+            yield from buffered
+            yield from chunks
+            return
+
+        # boyutu bilinmeyen gövdede eşik kadarını tamponla
+        size = sum(len(c) for c in buffered)
+        while size < self.mw.min_size and not exhausted:
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                exhausted = True
+                break
+            buffered.append(chunk)
+            size += len(chunk)
+
+        if exhausted and size < self.mw.min_size:
+            self.start_response(status, headers, exc_info)
+            yield from buffered
+            return
+
+        out_headers = []
+        for key, value in headers:
+            lk = key.lower()
+            if lk == "content-length":
+                continue
+            if lk == "etag" and not value.startswith("W/"):
+                value = "W/" + value  # sıkıştırılmış gösterim bayt-bayt aynı değil
+            out_headers.append((key, value))
+        out_headers.append(("Content-Encoding", self.encoding))
+        self.start_response(status, out_headers, exc_info)
+
+        compressor = _Compressor(self.encoding, self.mw.level, self.mw.brotli_quality)
+        data = compressor.compress(b"".join(buffered), flush=True)
+        if data:
+            yield data
+        pending = 0
+        for chunk in chunks:
+            if not chunk:
+                continue
+            pending += len(chunk)
+            flush = pending >= self.mw.flush_bytes
+            if flush:
+                pending = 0
+            data = compressor.compress(chunk, flush=flush)
+            if data:
+                yield data
+        yield compressor.finish()
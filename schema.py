@@ -0,0 +1,487 @@
+"""
+Veritabanı şeması ve sürümlü migration'lar.
+
+Her migration (version, name, steps) şeklindedir; step ya bir SQL cümlesi ya da
+cursor alan bir fonksiyondur. Tüm adımlar idempotent yazılır (IF NOT EXISTS,
+index varlık kontrolü), böylece yarıda kalan bir migration tekrar çalıştırılabilir.
+Uygulanan sürümler schema_migrations tablosunda tutulur. Migration'lar yalnızca
+`flask db-upgrade` (container açılışında gunicorn'dan önce) ile uygulanır.
+
+Uygulamanın sıcak sorgularının metinleri de buradadır; EXPLAIN kontrolü aynı metinleri kullanır.
+"""
+
+SCHEMA_LOCK_NAME = "survey_app_schema"
+SCHEMA_LOCK_TIMEOUT = 30
+
+_TABLE_OPTS = "ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+
+
+def ensure_index(table, name, columns):
+    """
+    columns ile başlayan bir index yoksa oluşturur (MySQL'de CREATE INDEX IF NOT EXISTS yok).
+    Aynı kolonlarla başlayan başka isimli bir index (ör. FK index'i) varsa yenisi eklenmez.
+    """
+    def step(cur):
+        cur.execute(
+            """
+            SELECT index_name AS idx, column_name AS col
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s
+            ORDER BY index_name, seq_in_index
+            """,
+            (table,)
+        )
+        existing = {}
+        for r in cur.fetchall():
+            existing.setdefault(r["idx"], []).append(r["col"])
+        for cols in existing.values():
+            if [c.lower() for c in cols[:len(columns)]] == [c.lower() for c in columns]:
+                return
+        cur.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+
+    step.__name__ = f"ensure_index_{name}"
+    return step
+
+
+def ensure_column(table, column, definition):
+    """Kolon yoksa ALTER TABLE ... ADD COLUMN (MySQL'de ADD COLUMN IF NOT EXISTS yok)."""
+    def step(cur):
+        cur.execute(
+            """
+            SELECT COUNT(*) AS c
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+            """,
+            (table, column)
+        )
+        if not (cur.fetchone() or {}).get("c"):
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    step.__name__ = f"ensure_column_{table}_{column}"
+    return step
+
+
+MIGRATIONS = [
+    (1, "base_tables", [
+        f"""
+        CREATE TABLE IF NOT EXISTS surveys (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS questions (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            survey_id INT NOT NULL,
+            question_text TEXT NOT NULL,
+            question_type VARCHAR(32) NOT NULL DEFAULT 'single_choice',
+            is_required TINYINT(1) NOT NULL DEFAULT 0,
+            rating_min INT NULL,
+            rating_max INT NULL
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS options (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            question_id INT NOT NULL,
+            option_text VARCHAR(500) NOT NULL,
+            is_other TINYINT(1) NOT NULL DEFAULT 0
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS participant_fields (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            survey_id INT NOT NULL,
+            field_label VARCHAR(255) NULL,
+            field_type VARCHAR(32) NOT NULL DEFAULT 'text',
+            is_required TINYINT(1) NOT NULL DEFAULT 0,
+            sort_order INT NOT NULL DEFAULT 0,
+            system_key VARCHAR(64) NULL
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS participant_field_options (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            field_id INT NOT NULL,
+            option_text VARCHAR(500) NOT NULL,
+            sort_order INT NOT NULL DEFAULT 0
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS participants (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            survey_id INT NOT NULL,
+            first_name VARCHAR(100) NULL,
+            last_name VARCHAR(100) NULL,
+            email VARCHAR(255) NULL,
+            duration_seconds INT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS participant_answers (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            participant_id INT NOT NULL,
+            field_id INT NOT NULL,
+            option_id INT NULL,
+            answer_text TEXT NULL
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS responses (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            survey_id INT NOT NULL,
+            participant_id INT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS answers (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            response_id INT NOT NULL,
+            question_id INT NOT NULL,
+            option_id INT NULL,
+            answer_text TEXT NULL,
+            answer_number INT NULL
+        ) {_TABLE_OPTS}
+        """,
+    ]),
+    (2, "aggregate_counters", [
+        f"""
+        CREATE TABLE IF NOT EXISTS question_option_counts (
+            question_id INT NOT NULL,
+            option_id INT NOT NULL,
+            vote_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (question_id, option_id)
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS question_rating_counts (
+            question_id INT NOT NULL,
+            rating INT NOT NULL,
+            vote_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (question_id, rating)
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS text_answer_stats (
+            question_id INT NOT NULL,
+            answer_count INT NOT NULL DEFAULT 0,
+            total_length BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (question_id)
+        ) {_TABLE_OPTS}
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS text_token_counts (
+            question_id INT NOT NULL,
+            token VARCHAR(191) NOT NULL,
+            token_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (question_id, token),
+            KEY idx_text_token_counts_rank (question_id, token_count)
+        ) {_TABLE_OPTS} COLLATE=utf8mb4_bin
+        """,
+    ]),
+    (3, "hot_query_indexes", [
+        ensure_index("questions", "idx_questions_survey", ["survey_id"]),
+        ensure_index("options", "idx_options_question", ["question_id"]),
+        ensure_index("participant_fields", "idx_participant_fields_survey", ["survey_id", "sort_order"]),
+        ensure_index("participant_field_options", "idx_pf_options_field", ["field_id", "sort_order"]),
+        ensure_index("answers", "idx_answers_question_option", ["question_id", "option_id"]),
+        ensure_index("answers", "idx_answers_question_number", ["question_id", "answer_number"]),
+        ensure_index("answers", "idx_answers_response", ["response_id"]),
+        ensure_index("responses", "idx_responses_survey_participant", ["survey_id", "participant_id"]),
+        ensure_index("responses", "idx_responses_participant", ["participant_id"]),
+        ensure_index("participants", "idx_participants_survey_created", ["survey_id", "created_at"]),
+        ensure_index("participant_answers", "idx_pa_field_option", ["field_id", "option_id"]),
+        ensure_index("participant_answers", "idx_pa_participant", ["participant_id"]),
+    ]),
+    (4, "survey_soft_delete", [
+        ensure_column("surveys", "deleted_at", "TIMESTAMP NULL DEFAULT NULL"),
+        f"""
+        CREATE TABLE IF NOT EXISTS survey_purge_jobs (
+            survey_id INT NOT NULL PRIMARY KEY,
+            status VARCHAR(16) NOT NULL DEFAULT 'pending',
+            step VARCHAR(64) NULL,
+            deleted_rows BIGINT NOT NULL DEFAULT 0,
+            error TEXT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP NULL DEFAULT NULL
+        ) {_TABLE_OPTS}
+        """,
+    ]),
+    (5, "crosstab_indexes", [
+        # kırılım sorgusu: katılımcının tek bir alandaki cevabı (index-only)
+        ensure_index("participant_answers", "idx_pa_participant_field", ["participant_id", "field_id", "option_id"]),
+    ]),
+    (6, "survey_data_version", [
+        # JSON API ETag'i: her gönderim ve tanım değişikliğinde artar
+        ensure_column("surveys", "data_version", "BIGINT NOT NULL DEFAULT 0"),
+    ]),
+    (7, "survey_archive", [
+        # archived_at: gönderime kapandı / arşivleme istendi; archive_file dolunca okumalar
+        # dosyadan yapılır; archive_finished_at: ham satırlar silindi
+        ensure_column("surveys", "archived_at", "TIMESTAMP NULL DEFAULT NULL"),
+        ensure_column("surveys", "archive_file", "VARCHAR(255) NULL DEFAULT NULL"),
+        ensure_column("surveys", "archive_finished_at", "TIMESTAMP NULL DEFAULT NULL"),
+    ]),
+    (8, "survey_definition_version", [
+        # tanım cache'lerinin anahtarı: anketi, sorularını ya da katılımcı alanlarını değiştiren
+        # transaction'da artar; her worker bir sonraki istekte yeni tanımı görür
+        ensure_column("surveys", "definition_version", "BIGINT NOT NULL DEFAULT 0"),
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def _ensure_migrations_table(cur):
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT NOT NULL PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) {_TABLE_OPTS}
+    """)
+
+
+def applied_versions(conn):
+    with conn.cursor() as cur:
+        _ensure_migrations_table(cur)
+        cur.execute("SELECT version FROM schema_migrations")
+        return {int(r["version"]) for r in cur.fetchall()}
+
+
+def apply_migrations(conn, target=None):
+    """
+    Eksik migration'ları sırayla uygular, uygulanan sürümleri döner.
+    Birden fazla worker aynı anda açılırsa GET_LOCK ile tek seferde biri çalışır.
+    """
+    target = LATEST_VERSION if target is None else target
+    applied = []
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT GET_LOCK(%s, %s) AS l", (SCHEMA_LOCK_NAME, SCHEMA_LOCK_TIMEOUT))
+        if not (cur.fetchone() or {}).get("l"):
+            raise RuntimeError("schema kilidi alınamadı")
+        try:
+            done = applied_versions(conn)
+            for version, name, steps in MIGRATIONS:
+                if version in done or version > target:
+                    continue
+                for step in steps:
+                    if callable(step):
+                        step(cur)
+                    else:
+                        cur.execute(step)
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (version, name)
+                )
+                conn.commit()
+                applied.append(version)
+        finally:
+            cur.execute("SELECT RELEASE_LOCK(%s)", (SCHEMA_LOCK_NAME,))
+            conn.commit()
+
+    return applied
+
+
+def pending_versions(conn):
+    """
+    Henüz uygulanmamış migration sürümleri. DDL çalıştırmaz (schema_migrations tablosu
+    yoksa hepsi bekliyor sayılır); worker açılışındaki kontrol için.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT COUNT(*) AS c
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name = 'schema_migrations'
+        """)
+        done = set()
+        if (cur.fetchone() or {}).get("c"):
+            cur.execute("SELECT version FROM schema_migrations")
+            done = {int(r["version"]) for r in cur.fetchall()}
+    return [version for version, _, _ in MIGRATIONS if version not in done]
+
+
+# ---------------- Sıcak sorgular ----------------
+# Uygulama bu metinleri doğrudan çalıştırır; HOT_QUERIES / explain_hot_queries de aynı
+# metinleri EXPLAIN eder, böylece index doğrulaması gerçek sorgulardan kopmaz.
+
+# build_question_analytics (parametre: survey_id)
+QSTATS_RESPONDERS_SQL = """
+    SELECT a.question_id, COUNT(DISTINCT a.response_id) AS responders
+    FROM answers a
+    JOIN responses r ON r.id = a.response_id
+    WHERE r.survey_id=%s
+    GROUP BY a.question_id
+"""
+
+QSTATS_OPTION_COUNTS_SQL = """
+    SELECT o.question_id, o.id, o.option_text, COALESCE(c.vote_count, 0) AS cnt
+    FROM options o
+    JOIN questions q ON q.id = o.question_id
+    LEFT JOIN question_option_counts c
+        ON c.question_id = o.question_id AND c.option_id = o.id
+    WHERE q.survey_id=%s AND q.question_type IN ('single_choice', 'multiple_choice')
+    ORDER BY o.id ASC
+"""
+
+# load_answer_counters / build_question_analytics: rating histogramı sayaç tablosundan
+RATING_COUNTS_SQL = """
+    SELECT c.question_id, c.rating, c.vote_count
+    FROM question_rating_counts c
+    JOIN questions q ON q.id = c.question_id
+    WHERE q.survey_id=%s AND c.vote_count > 0
+"""
+
+QSTATS_TEXT_STATS_SQL = """
+    SELECT s.question_id, s.answer_count, s.total_length
+    FROM text_answer_stats s
+    JOIN questions q ON q.id = s.question_id
+    WHERE q.survey_id=%s
+"""
+
+QSTATS_TOP_WORDS_SQL = """
+    SELECT question_id, token, token_count
+    FROM (
+        SELECT t.question_id, t.token, t.token_count,
+               ROW_NUMBER() OVER (
+                   PARTITION BY t.question_id
+                   ORDER BY t.token_count DESC, t.token ASC
+               ) AS rn
+        FROM text_token_counts t
+        JOIN questions q ON q.id = t.question_id
+        WHERE q.survey_id=%s AND q.question_type='text'
+    ) ranked
+    WHERE rn <= 20
+    ORDER BY question_id, rn
+"""
+
+# fetch_participants_page: PARTICIPANTS_PAGE_SQL + [filtre] + [PARTICIPANTS_AFTER_SQL] + PARTICIPANTS_ORDER_SQL
+PARTICIPANTS_PAGE_SQL = """
+    SELECT p.id, p.first_name, p.last_name, p.email, p.created_at, p.created_at AS ts, p.duration_seconds
+    FROM participants p
+    WHERE p.survey_id=%s
+"""
+PARTICIPANTS_AFTER_SQL = " AND (p.created_at < %s OR (p.created_at = %s AND p.id < %s))"
+PARTICIPANTS_ORDER_SQL = " ORDER BY p.created_at DESC, p.id DESC LIMIT %s"
+
+# participant_filter_sql, seçenekli alan (parametreler: field_id, option_id, option_id)
+PARTICIPANT_CHOICE_FILTER_SQL = """
+    AND EXISTS (
+        SELECT 1
+        FROM participant_answers pa
+        WHERE pa.participant_id = p.id
+          AND pa.field_id = %s
+          AND (
+               pa.option_id = %s
+               OR pa.answer_text = (SELECT option_text FROM participant_field_options WHERE id=%s)
+          )
+    )
+"""
+
+# _crosstab_counts (parametreler: field_id, question_id, survey_id); {val_expr} soru tipine göre
+CROSSTAB_COUNTS_SQL = """
+    SELECT t.seg, t.val, COUNT(DISTINCT t.response_id) AS cnt
+    FROM (
+        SELECT r.id AS response_id,
+               COALESCE(pa.option_id, 0) AS seg,
+               {val_expr} AS val
+        FROM answers a
+        JOIN responses r ON r.id = a.response_id
+        LEFT JOIN participant_answers pa
+            ON pa.participant_id = r.participant_id AND pa.field_id = %s
+        WHERE a.question_id = %s AND r.survey_id = %s
+    ) t
+    WHERE t.val IS NOT NULL
+    GROUP BY t.seg, t.val WITH ROLLUP
+"""
+CROSSTAB_CHOICE_VALUE = "a.option_id"
+CROSSTAB_RATING_VALUE = "a.answer_number"  # eski metin puanları rebuild_answer_counters'ta sayıya taşınır
+
+# show_results: katılımcının son cevabı (parametreler: survey_id, participant_id)
+LATEST_RESPONSE_SQL = """
+    SELECT r.id AS response_id
+    FROM responses r
+    WHERE r.survey_id=%s AND r.participant_id=%s
+    ORDER BY r.id DESC
+    LIMIT 1
+"""
+
+
+def _explain_sample(cur, survey_id):
+    """EXPLAIN parametreleri için anketin gerçek id'leri (sabit değerler plan seçimini bozar)."""
+    sample = {"survey_id": survey_id}
+    for key, sql in (
+        ("choice_question", "SELECT id FROM questions WHERE survey_id=%s AND question_type IN ('single_choice', 'multiple_choice') ORDER BY id LIMIT 1"),
+        ("rating_question", "SELECT id FROM questions WHERE survey_id=%s AND question_type='rating' ORDER BY id LIMIT 1"),
+        ("participant", "SELECT id FROM participants WHERE survey_id=%s ORDER BY id DESC LIMIT 1"),
+    ):
+        cur.execute(sql, (survey_id,))
+        sample[key] = (cur.fetchone() or {}).get("id") or 0
+    cur.execute("""
+        SELECT f.id AS field_id, o.id AS option_id
+        FROM participant_fields f
+        JOIN participant_field_options o ON o.field_id = f.id
+        WHERE f.survey_id=%s AND f.field_type IN ('single_choice', 'multiple_choice')
+        ORDER BY f.sort_order, o.sort_order
+        LIMIT 1
+    """, (survey_id,))
+    row = cur.fetchone() or {}
+    sample["field"] = row.get("field_id") or 0
+    sample["field_option"] = row.get("option_id") or 0
+    return sample
+
+
+# (ad, sql, örnek id'lerden parametreler, beklenen index'ler). Beklenen index'lerin her biri
+# EXPLAIN'in key kolonunda görünmelidir; "a|b" eşdeğer alternatiflerden birinin yeterli olduğunu söyler.
+HOT_QUERIES = [
+    ("analytics.responders", QSTATS_RESPONDERS_SQL,
+     lambda s: (s["survey_id"],),
+     ["idx_responses_survey_participant", "idx_answers_response"]),
+    ("analytics.option_counts", QSTATS_OPTION_COUNTS_SQL,
+     lambda s: (s["survey_id"],),
+     ["idx_questions_survey", "idx_options_question"]),
+    ("counters.rating", RATING_COUNTS_SQL,
+     lambda s: (s["survey_id"],),
+     ["idx_questions_survey", "PRIMARY"]),
+    ("analytics.top_words", QSTATS_TOP_WORDS_SQL,
+     lambda s: (s["survey_id"],),
+     ["idx_questions_survey", "PRIMARY|idx_text_token_counts_rank"]),
+    ("participants.page", PARTICIPANTS_PAGE_SQL + PARTICIPANTS_ORDER_SQL,
+     lambda s: (s["survey_id"], 101),
+     ["idx_participants_survey_created"]),
+    ("participants.filter_choice", PARTICIPANTS_PAGE_SQL + PARTICIPANT_CHOICE_FILTER_SQL + PARTICIPANTS_ORDER_SQL,
+     lambda s: (s["survey_id"], s["field"], s["field_option"], s["field_option"], 101),
+     ["idx_participants_survey_created", "idx_pa_participant_field|idx_pa_participant|idx_pa_field_option"]),
+    ("analytics.crosstab_choice", CROSSTAB_COUNTS_SQL.format(val_expr=CROSSTAB_CHOICE_VALUE),
+     lambda s: (s["field"], s["choice_question"], s["survey_id"]),
+     ["idx_answers_question_option", "idx_pa_participant_field"]),
+    ("analytics.crosstab_rating", CROSSTAB_COUNTS_SQL.format(val_expr=CROSSTAB_RATING_VALUE),
+     lambda s: (s["field"], s["rating_question"], s["survey_id"]),
+     ["idx_answers_question_number", "idx_pa_participant_field"]),
+    ("results.latest_response", LATEST_RESPONSE_SQL,
+     lambda s: (s["survey_id"], s["participant"]),
+     ["idx_responses_survey_participant"]),
+]
+
+
+def explain_hot_queries(conn, survey_id):
+    """
+    Her sıcak sorgu için (ad, kullanılan index'ler, eksik beklenen index'ler). Sorgular anketin
+    gerçek soru / alan / katılımcı id'leriyle EXPLAIN edilir; eksik listesi boşsa sorgu geçer.
+    Anlamlı bir plan için ankette her soru tipinden soru ve seçenekli bir katılımcı alanı olmalı.
+    """
+    report = []
+    with conn.cursor() as cur:
+        sample = _explain_sample(cur, survey_id)
+        for name, sql, args, expected in HOT_QUERIES:
+            cur.execute("EXPLAIN " + sql, args(sample))
+            used = {r.get("key") for r in cur.fetchall() if r.get("key")}
+            missing = [alt for alt in expected if not used & set(alt.split("|"))]
+            report.append((name, sorted(used), missing))
+    return report
@@ -0,0 +1,284 @@
+function toggleFilters() {
+  const box = document.getElementById("filterBox");
+  if (!box) return;
+  box.style.display = (box.style.display === "none" || box.style.display === "") ? "block" : "none";
+}
+function hideFiltersSoon(){
+  const box = document.getElementById("filterBox");
+  if (!box) return;
+  box.style.display = "none";
+}
+async function loadMoreParticipants(btn) {
+  const select = document.getElementById("participantSelect");
+  btn.disabled = true;
+  const sep = btn.dataset.url.includes("?") ? "&" : "?";
+  const res = await fetch(btn.dataset.url + sep + "cursor=" + encodeURIComponent(btn.dataset.cursor));
+  const data = await res.json();
+  (data.participants || []).forEach(p => {
+    const fn = (p.first_name || "").trim();
+    const ln = (p.last_name || "").trim();
+    const label = (ln ? fn + " " + ln[0] + "." : fn).trim() || "Katılımcı";
+    select.add(new Option(`#${p.index} • ${label}`, p.id));
+  });
+  if (data.next_cursor) {
+    btn.dataset.cursor = data.next_cursor;
+    btn.disabled = false;
+  } else {
+    btn.remove();
+  }
+}
+
+const CHART_COLORS = [
+  '#6366f1', // indigo
+  '#4abea1', // green
+  '#ff609e', // pink
+  '#ffc659', // amber
+  '#06b6d4', // cyan
+  '#a855f7', // violet
+  '#ef4444', // red
+  '#84cc16'  // lime
+];
+
+function pickColors(n) {
+  const arr = [];
+  for (let i = 0; i < n; i++) arr.push(CHART_COLORS[i % CHART_COLORS.length]);
+  return arr;
+}
+
+(function () {
+  const payload = window.__qcharts || [];
+  if (!payload || payload.length === 0) return;
+
+  window.__charts = window.__charts || {};
+
+  const gridColor = "rgba(148, 163, 184, 0.18)";
+  const tickColor = "rgba(71, 85, 105, 0.9)";
+
+  payload.forEach(item => {
+    const canvasId = `chart_q_${item.qid}`;
+    const el = document.getElementById(canvasId);
+    if (!el) return;
+
+    if (window.__charts[canvasId]) window.__charts[canvasId].destroy();
+
+    const ctx = el.getContext("2d");
+    const labels = item.labels || [];
+    const data = item.data || [];
+    const qtype = item.qtype || item.type; 
+
+    let config = {
+      type: 'bar',
+      data: {
+        labels,
+        datasets: [{
+          label: 'Adet',
+          data,
+          backgroundColor: 'rgba(59, 130, 246, 0.80)',
+          borderWidth: 0,
+          borderRadius: 10,
+          barPercentage: 0.65,
+          categoryPercentage: 0.7
+        }]
+      },
+      options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        animation: false,
+        plugins: {
+          legend: { display: false },
+          tooltip: { enabled: true, displayColors: false }
+        },
+        scales: {
+          y: { beginAtZero: true, ticks: { precision: 0, color: tickColor }, grid: { color: gridColor } },
+          x: { ticks: { color: tickColor }, grid: { display: false } }
+        }
+      }
+    };
+
+    // single_choice -> PIE (renkli)
+    if (qtype === "single_choice") {
+      config = {
+        type: 'pie',
+        data: {
+          labels,
+          datasets: [{
+            data,
+            backgroundColor: pickColors(labels.length),
+            borderColor: '#ffffff',
+            borderWidth: 2
+          }]
+        },
+        options: {
+          responsive: true,
+          maintainAspectRatio: false,
+          animation: false,
+          plugins: {
+            legend: { position: 'bottom', labels: { boxWidth: 12 } },
+            tooltip: { enabled: true, displayColors: true }
+          }
+        }
+      };
+    }
+
+    // multiple_choice -> horizontal bar (renkli)
+    else if (qtype === "multiple_choice") {
+      config = {
+        type: 'bar',
+        data: {
+          labels,
+          datasets: [{
+            label: 'Adet',
+            data,
+            backgroundColor: pickColors(labels.length),
+            borderRadius: 8,
+            borderWidth: 0,
+            barPercentage: 0.6
+          }]
+        },
+        options: {
+          indexAxis: 'y',
+          responsive: true,
+          maintainAspectRatio: false,
+          animation: false,
+          plugins: {
+            legend: { display: false },
+            tooltip: { enabled: true, displayColors: false }
+          },
+          scales: {
+            x: { beginAtZero: true, ticks: { precision: 0, color: tickColor }, grid: { color: gridColor } },
+            y: { ticks: { color: tickColor }, grid: { display: false } }
+          }
+        }
+      };
+    }
+
+    // rating -> bar (renkli)
+    else if (qtype === "rating") {
+      config = {
+        type: 'bar',
+        data: {
+          labels,
+          datasets: [{
+            label: 'Adet',
+            data,
+            backgroundColor: pickColors(labels.length),
+            borderRadius: 8,
+            borderWidth: 0
+          }]
+        },
+        options: {
+          responsive: true,
+          maintainAspectRatio: false,
+          animation: false,
+          plugins: {
+            legend: { display: false },
+            tooltip: { enabled: true, displayColors: false }
+          },
+          scales: {
+            y: { beginAtZero: true, ticks: { precision: 0, color: tickColor }, grid: { color: gridColor } },
+            x: { ticks: { color: tickColor }, grid: { display: false } }
+          }
+        }
+      };
+    }
+
+    window.__charts[canvasId] = new Chart(ctx, config);
+    window.__charts[canvasId].$keys = (item.keys || []).slice();
+  });
+})();
+
+// Canlı sonuçlar: SSE ile gelen sayaçlar mevcut grafiklere yerinde uygulanır
+(function () {
+  if (!window.__liveUrl || !window.EventSource) return;
+  const source = new EventSource(window.__liveUrl);
+
+  function setCount(qid, key, count, sorted) {
+    const chart = (window.__charts || {})[`chart_q_${qid}`];
+    if (!chart) return;
+    const keys = chart.$keys;
+    const ds = chart.data.datasets[0];
+    let i = keys.indexOf(key);
+    if (i === -1) {
+      if (!sorted) return;
+      // yeni puan kovası: sıralı yere ekle
+      i = keys.findIndex(k => k > key);
+      if (i === -1) i = keys.length;
+      keys.splice(i, 0, key);
+      chart.data.labels.splice(i, 0, String(key));
+      ds.data.splice(i, 0, 0);
+    }
+    ds.data[i] = count;
+    chart.$dirty = true;
+  }
+
+  function apply(ev) {
+    const d = JSON.parse(ev.data);
+    if (d.participant_count !== undefined) {
+      const el = document.getElementById("live_participant_count");
+      if (el) el.textContent = d.participant_count;
+    }
+    (d.options || []).forEach(o => setCount(o.qid, o.oid, o.count, false));
+    (d.ratings || []).forEach(r => setCount(r.qid, r.score, r.count, true));
+    Object.values(window.__charts || {}).forEach(c => {
+      if (c.$dirty) { c.$dirty = false; c.update("none"); }
+    });
+  }
+
+  source.addEventListener("snapshot", apply);
+  source.addEventListener("delta", apply);
+  source.addEventListener("deleted", () => source.close());
+
+  // sunucu SSE sınırında 503 döner ve EventSource kapanır: aynı tam durumu aralıklarla çek
+  // (ETag'le; veri değişmediyse 304)
+  source.addEventListener("error", () => {
+    if (source.readyState !== EventSource.CLOSED || !window.__livePollUrl) return;
+    const timer = setInterval(() => {
+      fetch(window.__livePollUrl, { credentials: "same-origin" })
+        .then(resp => {
+          if (resp.status === 404) { clearInterval(timer); return null; }
+          return resp.ok ? resp.text() : null;
+        })
+        .then(body => { if (body) apply({ data: body }); })
+        .catch(() => {});
+    }, window.__livePollMs || 2000);
+  });
+})();
+
+(function(){
+  if (!window.__participantStats) return;
+
+  const el = document.getElementById("participant_completion_chart");
+  if (!el) return;
+
+  window.__charts = window.__charts || {};
+  const key = "participant_completion_chart";
+  if (window.__charts[key]) window.__charts[key].destroy();
+
+  const s = window.__participantStats;
+  const done = s.answered || 0;
+  const total = s.total || 0;
+  const rest = Math.max(total - done, 0);
+
+  window.__charts[key] = new Chart(el.getContext("2d"), {
+    type: "doughnut",
+    data: {
+      labels: ["Cevaplanan", "Boş"],
+      datasets: [{
+        data: [done, rest],
+        backgroundColor: ["#22c55e", "#e5e7eb"],   // yeşil + gri
+        borderColor: ["#ffffff", "#ffffff"],
+        borderWidth: 2,
+        hoverOffset: 4
+      }]
+    },
+    options: {
+      responsive: true,
+      maintainAspectRatio: false,
+      cutout: "70%",
+      plugins: {
+        legend: { display: false },
+        tooltip: { enabled: true, displayColors: false }
+      }
+    }
+  });
+})();
@@ -0,0 +1,34 @@
+(function () {
+  const pfType = document.getElementById("pfType");
+  const sec = document.getElementById("pfOptionsSection");
+  const list = document.getElementById("pfOptionsList");
+  const addBtn = document.getElementById("pfAddOpt");
+
+  function createOpt(val="") {
+    const row = document.createElement("div");
+    row.className = "form-row align-items-center mb-2";
+    row.innerHTML = `
+      <div class="form-group col-md-10 mb-0">
+        <input type="text" name="pf_options[]" class="form-control" placeholder="Seçenek..." value="${val.replace(/"/g,'&quot;')}">
+      </div>
+      <div class="form-group col-md-2 mb-0 text-right">
+        <button type="button" class="btn btn-sm btn-outline-danger rounded-pill">Sil</button>
+      </div>
+    `;
+    row.querySelector("button").addEventListener("click", () => row.remove());
+    return row;
+  }
+
+  function update() {
+    const t = pfType.value;
+    const show = (t === "single_choice" || t === "multiple_choice");
+    sec.style.display = show ? "block" : "none";
+    if (show && list.children.length < 2) {
+      while (list.children.length < 2) list.appendChild(createOpt(""));
+    }
+  }
+
+  addBtn.addEventListener("click", () => list.appendChild(createOpt("")));
+  pfType.addEventListener("change", update);
+  update();
+})();
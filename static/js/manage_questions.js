@@ -0,0 +1,55 @@
+(function () {
+  const questionTypeEl = document.getElementById("questionType");
+  const optionsSection = document.getElementById("optionsSection");
+  const textSection = document.getElementById("textSection");
+  const ratingSection = document.getElementById("ratingSection");
+  const optionsList = document.getElementById("optionsList");
+  const addOptionBtn = document.getElementById("addOptionBtn");
+
+  function createOptionInput(value = "") {
+    const wrapper = document.createElement("div");
+    wrapper.className = "form-row align-items-center mb-2";
+    wrapper.innerHTML = `
+      <div class="form-group col-md-10 mb-0">
+        <input type="text" name="options[]" class="form-control" placeholder="Şık yaz..." value="${String(value).replace(/"/g, '&quot;')}">
+      </div>
+      <div class="form-group col-md-2 mb-0 text-right">
+        <button type="button" class="btn btn-sm btn-outline-danger rounded-pill removeOptionBtn">Sil</button>
+      </div>
+    `;
+    wrapper.querySelector(".removeOptionBtn").addEventListener("click", function () {
+      wrapper.remove();
+    });
+    return wrapper;
+  }
+
+  function ensureMinOptions() {
+    if (optionsList.children.length < 2) {
+      while (optionsList.children.length < 2) {
+        optionsList.appendChild(createOptionInput(""));
+      }
+    }
+  }
+
+  function updateUI() {
+    const t = questionTypeEl.value;
+    const isChoice = (t === "single_choice" || t === "multiple_choice");
+
+    optionsSection.style.display = isChoice ? "block" : "none";
+    textSection.style.display = (t === "text") ? "block" : "none";
+    ratingSection.style.display = (t === "rating") ? "block" : "none";
+
+    if (isChoice) ensureMinOptions();
+  }
+
+  addOptionBtn.addEventListener("click", function () {
+    optionsList.appendChild(createOptionInput(""));
+  });
+
+  questionTypeEl.addEventListener("change", updateUI);
+
+  // ilk yükleme: 2 şıkla başlasın
+  optionsList.appendChild(createOptionInput(""));
+  optionsList.appendChild(createOptionInput(""));
+  updateUI();
+})();
@@ -0,0 +1,18 @@
+async function loadMoreParticipants(btn) {
+  const select = document.getElementById("participantSelect");
+  btn.disabled = true;
+  const res = await fetch(btn.dataset.url + "?cursor=" + encodeURIComponent(btn.dataset.cursor));
+  const data = await res.json();
+  (data.participants || []).forEach(p => {
+    const fn = (p.first_name || "").trim();
+    const ln = (p.last_name || "").trim();
+    const label = (fn + " " + (ln ? ln[0] + "." : "")).trim() || "Katılımcı";
+    select.add(new Option(`Katılımcı #${p.index} – ${label}`, p.id));
+  });
+  if (data.next_cursor) {
+    btn.dataset.cursor = data.next_cursor;
+    btn.disabled = false;
+  } else {
+    btn.remove();
+  }
+}
@@ -0,0 +1,104 @@
+(function () {
+  // --- More menu toggle ---
+  document.addEventListener("click", function (e) {
+    const more = e.target.closest(".survey-more");
+    document.querySelectorAll(".survey-more.open").forEach(x => {
+      if (!more || x !== more) x.classList.remove("open");
+    });
+    if (more && e.target.closest(".more-btn")) {
+      more.classList.toggle("open");
+    }
+    if (!more) {
+      document.querySelectorAll(".survey-more.open").forEach(x => x.classList.remove("open"));
+    }
+  });
+
+  // --- Search + sort (client-side) ---
+  const searchEl = document.getElementById("surveySearch");
+  const sortEl = document.getElementById("surveySort");
+  const grid = document.getElementById("surveyGrid");
+  const noResults = document.getElementById("noResults");
+
+  if (!grid) return;
+
+  function getItems() {
+    return Array.from(grid.querySelectorAll(".survey-item"));
+  }
+
+  function applyFilter() {
+    const q = (searchEl.value || "").trim().toLowerCase();
+    let visible = 0;
+
+    getItems().forEach(item => {
+      const t = item.dataset.title || "";
+      const d = item.dataset.desc || "";
+      const ok = !q || t.includes(q) || d.includes(q);
+      item.style.display = ok ? "" : "none";
+      if (ok) visible++;
+    });
+
+    if (noResults) noResults.style.display = visible === 0 ? "" : "none";
+  }
+
+  function applySort() {
+    const mode = sortEl.value;
+    const items = getItems();
+
+    items.sort((a, b) => {
+      const aCreated = a.dataset.created || "";
+      const bCreated = b.dataset.created || "";
+      const aQC = parseInt(a.dataset.qc || "0", 10);
+      const bQC = parseInt(b.dataset.qc || "0", 10);
+      const aRC = parseInt(a.dataset.rc || "0", 10);
+      const bRC = parseInt(b.dataset.rc || "0", 10);
+      const aTitle = a.dataset.title || "";
+      const bTitle = b.dataset.title || "";
+
+      if (mode === "newest") return (bCreated > aCreated) ? 1 : -1;
+      if (mode === "oldest") return (aCreated > bCreated) ? 1 : -1;
+      if (mode === "responses_desc") return bRC - aRC;
+      if (mode === "questions_desc") return bQC - aQC;
+      if (mode === "title_asc") return aTitle.localeCompare(bTitle, "tr");
+      return 0;
+    });
+
+    items.forEach(it => grid.appendChild(it));
+  }
+
+  if (searchEl) searchEl.addEventListener("input", applyFilter);
+  if (sortEl) sortEl.addEventListener("change", function () {
+    applySort();
+    applyFilter();
+  });
+
+  applySort();
+  applyFilter();
+})();
+
+document.addEventListener("click", async function(e){
+  const btn = e.target.closest(".copy-link-btn");
+  if (!btn) return;
+
+  const link = btn.dataset.link;
+  if (!link) return;
+
+  const toast = document.getElementById("toast");
+
+  try{
+    await navigator.clipboard.writeText(link);
+  }catch(err){
+    // fallback
+    const ta = document.createElement("textarea");
+    ta.value = link;
+    document.body.appendChild(ta);
+    ta.select();
+    document.execCommand("copy");
+    document.body.removeChild(ta);
+  }
+
+  toast.classList.add("show");
+
+  setTimeout(() => {
+    toast.classList.remove("show");
+  }, 1200);
+});
@@ -0,0 +1,47 @@
+(function(){
+  const form = document.getElementById("takeSurveyForm");
+  const modal = document.getElementById("thankModal");
+  const okBtn = document.getElementById("thankOkBtn");
+  const startEl = document.getElementById("start_ts");
+  const durEl = document.getElementById("duration_seconds");
+
+  if (!form || !modal || !okBtn || !startEl || !durEl) return;
+
+  startEl.value = Date.now().toString();
+
+  function openModal(){ modal.style.display = "flex"; }
+  function closeModal(){ modal.style.display = "none"; }
+
+  okBtn.addEventListener("click", function(){
+    closeModal();
+    form.reset();
+    window.scrollTo({ top: 0, behavior: "smooth" });
+    startEl.value = Date.now().toString();
+  });
+
+  form.addEventListener("submit", async function(e){
+    e.preventDefault();
+
+    const start = parseInt(startEl.value || "0", 10);
+    durEl.value = start ? Math.max(0, Math.round((Date.now() - start) / 1000)).toString() : "";
+
+    try{
+      const res = await fetch(window.location.href, {
+        method: "POST",
+        body: new FormData(form),
+        headers: { "X-Requested-With": "XMLHttpRequest" }
+      });
+
+      const data = await res.json().catch(() => null);
+
+      if (!res.ok || !data || !data.ok) {
+        alert((data && data.error) ? data.error : "Bir hata oluştu. Tekrar deneyin.");
+        return;
+      }
+
+      openModal();
+    } catch(err){
+      alert("Sunucuya bağlanılamadı.");
+    }
+  });
+})();
@@ -0,0 +1,40 @@
+"""assets-build yalnızca repodaki static/ dosyalarından çalışır; eksik vendor dosyası hatadır."""
+import os
+import shutil
+
+import pytest
+
+import assets
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+
+@pytest.fixture
+def static_copy(tmp_path):
+    target = tmp_path / "static"
+    shutil.copytree(STATIC_DIR, target, ignore=shutil.ignore_patterns(assets.DIST_DIRNAME))
+    return str(target)
+
+
+def test_vendor_files_are_committed():
+    assets.check_vendor(STATIC_DIR)
+
+
+def test_build_fingerprints_vendor_files(static_copy):
+    assets.build(static_copy)
+    manifest = assets.load_manifest(static_copy)
+
+    for name in assets.VENDOR:
+        assert os.path.isfile(os.path.join(static_copy, assets.DIST_DIRNAME, manifest[name]))
+
+    css_path = os.path.join(static_copy, assets.DIST_DIRNAME, manifest["vendor/fonts/poppins.css"])
+    with open(css_path, encoding="utf-8") as f:
+        css = f.read()
+    assert "http" not in css
+    assert os.path.basename(manifest["vendor/fonts/poppins-regular.woff2"]) in css
+
+
+def test_missing_vendor_file_fails_build(static_copy):
+    os.remove(os.path.join(static_copy, "vendor/chart.js/chart.umd.min.js"))
+    with pytest.raises(RuntimeError, match="chart.umd.min.js"):
+        assets.build(static_copy)
@@ -0,0 +1,125 @@
+"""CompressionMiddleware: içerik pazarlığı, min_size eşiği, ETag zayıflatma ve Vary başlığı."""
+import gzip
+
+import pytest
+from werkzeug.test import Client
+
+import compression
+
+
+def make_app(body, content_type="application/json", headers=(), stream=False, status="200 OK"):
+    def wsgi_app(environ, start_response):
+        start_response(status, [("Content-Type", content_type), *headers]
+                       + ([] if stream else [("Content-Length", str(len(body)))]))
+        if stream:
+            return (body[i:i + 100] for i in range(0, len(body), 100))
+        return [body]
+    return wsgi_app
+
+
+def get(app, accept=None, min_size=1024, method="GET"):
+    client = Client(compression.CompressionMiddleware(app, min_size=min_size))
+    headers = {"Accept-Encoding": accept} if accept is not None else {}
+    return client.open("/", method=method, headers=headers)
+
+
+BIG = b'{"rows": [' + b",".join(b'{"id": %d, "text": "merhaba"}' % i for i in range(400)) + b"]}"
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip;q=0.8, br", {"gzip": 0.8, "br": 1.0}),
+    ("GZIP , identity;q=0", {"gzip": 1.0, "identity": 0.0}),
+    ("gzip;q=abc", {"gzip": 0.0}),
+    ("", {}),
+    (None, {}),
+])
+def test_parse_accept_encoding(header, expected):
+    assert compression.parse_accept_encoding(header) == expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br", "br"),             # eşitlikte available sırası
+    ("gzip, br;q=0.5", "gzip"),
+    ("br;q=0, gzip;q=0", None),
+    ("*", "br"),
+    ("*;q=0.1, gzip;q=0", "br"),
+    ("deflate", None),
+    (None, None),
+])
+def test_choose_encoding(header, expected):
+    assert compression.choose_encoding(header, ("br", "gzip")) == expected
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_gzip_round_trip(stream):
+    resp = get(make_app(BIG, stream=stream), accept="gzip")
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in resp.headers
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(resp.get_data()) == BIG
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli kurulu değil")
+def test_brotli_round_trip():
+    resp = get(make_app(BIG, stream=True), accept="br, gzip")
+    assert resp.headers["Content-Encoding"] == "br"
+    assert compression.brotli.decompress(resp.get_data()) == BIG
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_small_body_passes_through_with_vary(stream):
+    body = b'{"ok": true}'
+    resp = get(make_app(body, stream=stream), accept="gzip")
+    assert "Content-Encoding" not in resp.headers
+    assert resp.get_data() == body
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_uncompressed_for_client_without_accept_encoding_still_varies():
+    resp = get(make_app(BIG), accept=None)
+    assert "Content-Encoding" not in resp.headers
+    assert resp.get_data() == BIG
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_head_request_varies():
+    resp = get(make_app(BIG), accept="gzip", method="HEAD")
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_existing_vary_is_merged():
+    app = make_app(BIG, headers=[("Vary", "Cookie"), ("Vary", "accept-encoding")])
+    for accept in ("gzip", None):
+        assert get(app, accept=accept).headers.get_all("Vary") == ["Cookie, accept-encoding"]
+
+
+def test_incompressible_type_untouched():
+    resp = get(make_app(BIG, content_type="image/png"), accept="gzip")
+    assert "Content-Encoding" not in resp.headers
+    assert "Vary" not in resp.headers
+    assert resp.get_data() == BIG
+
+
+def test_no_transform_untouched():
+    app = make_app(BIG, headers=[("Cache-Control", "no-transform")])
+    resp = get(app, accept="gzip")
+    assert "Content-Encoding" not in resp.headers
+    assert "Vary" not in resp.headers
+
+
+def test_strong_etag_weakened_when_compressed():
+    app = make_app(BIG, headers=[("ETag", '"abc"')])
+    assert get(app, accept="gzip").headers["ETag"] == 'W/"abc"'
+    assert get(app, accept=None).headers["ETag"] == '"abc"'
+
+    weak = make_app(BIG, headers=[("ETag", 'W/"abc"')])
+    assert get(weak, accept="gzip").headers["ETag"] == 'W/"abc"'
+
+
+def test_not_modified_untouched_but_varies():
+    app = make_app(b"", headers=[("ETag", '"abc"')], status="304 Not Modified")
+    resp = get(app, accept="gzip", min_size=0)
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["ETag"] == '"abc"'
+    assert resp.headers["Vary"] == "Accept-Encoding"
@@ -0,0 +1,39 @@
+"""
+Uygulamanın sıcak sorguları (schema.py'deki ortak SQL metinleri) beklenen index'lerin
+hepsini kullanmalı. Küçük tablolarda optimizer tam taramayı seçebileceği için birkaç
+anketlik veri üretilir ve istatistikler ANALYZE TABLE ile tazelenir.
+"""
+import pytest
+
+import app as survey_app
+import schema
+from bench.seed import seed
+
+
+@pytest.fixture(scope="module")
+def explain_survey(mysql_conn):
+    manifest = seed(mysql_conn, surveys=4, participants=1500, questions_per_type=2, random_seed=11)
+    for survey in manifest["surveys"]:
+        survey_app.rebuild_answer_counters(mysql_conn, survey["id"])
+        survey_app.rebuild_text_index(mysql_conn, survey["id"])
+
+    with mysql_conn.cursor() as cur:
+        cur.execute("""
+            ANALYZE TABLE questions, options, participants, participant_fields, participant_field_options,
+                          participant_answers, responses, answers, question_option_counts,
+                          question_rating_counts, text_answer_stats, text_token_counts
+        """)
+        cur.fetchall()
+    mysql_conn.commit()
+    return manifest["surveys"][1]["id"]
+
+
+@pytest.mark.parametrize("name", [q[0] for q in schema.HOT_QUERIES])
+def test_hot_query_uses_expected_indexes(mysql_conn, explain_survey, name):
+    report = {n: (used, missing) for n, used, missing in schema.explain_hot_queries(mysql_conn, explain_survey)}
+    used, missing = report[name]
+    assert not missing, f"{name}: kullanılan {used}, eksik {missing}"
+
+
+def test_schema_has_no_pending_migrations(mysql_conn):
+    assert schema.pending_versions(mysql_conn) == []
@@ -0,0 +1,56 @@
+"""
+Katılımcı filtre index'i artımlı tazelenir; id sırasına göre geç commit edilen katılımcılar
+(high_water'ın altında kalan id'ler) tail penceresi içindeyse bir sonraki refresh'te görünmeli.
+"""
+import pytest
+
+import app as survey_app
+from bench.seed import seed
+
+
+@pytest.fixture(scope="module")
+def indexed_survey(mysql_conn):
+    manifest = seed(mysql_conn, surveys=1, participants=200, questions_per_type=1, random_seed=5)
+    survey_id = manifest["surveys"][0]["id"]
+    fields = survey_app.load_participant_fields_with_options(mysql_conn, survey_id)
+    field = next(f for f in fields if f["field_type"] == "single_choice" and f["options"])
+    with mysql_conn.cursor() as cur:
+        cur.execute("SELECT MAX(id) AS mx FROM participants")
+        max_id = int(cur.fetchone()["mx"])
+    return survey_id, fields, field, max_id
+
+
+def _insert_participant(conn, participant_id, survey_id, field_id, option_id):
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO participants (id, survey_id, duration_seconds) VALUES (%s, %s, %s)",
+            (participant_id, survey_id, 30)
+        )
+        cur.execute(
+            "INSERT INTO participant_answers (participant_id, field_id, option_id) VALUES (%s, %s, %s)",
+            (participant_id, field_id, option_id)
+        )
+    conn.commit()
+
+
+def test_out_of_order_commit_is_indexed(mysql_conn, indexed_survey):
+    survey_id, fields, field, max_id = indexed_survey
+    option_id = field["options"][0]["id"]
+    flt = [(field["id"], field["field_type"], str(option_id))]
+
+    index = survey_app.ParticipantFilterIndex(survey_id, fields, tail=50)
+    index.refresh(mysql_conn)
+    before = index.participants
+
+    # önce büyük id commit edilir, küçük id'li eşzamanlı gönderim ondan sonra
+    _insert_participant(mysql_conn, max_id + 20, survey_id, field["id"], option_id)
+    assert index.refresh(mysql_conn) == 1
+    _insert_participant(mysql_conn, max_id + 10, survey_id, field["id"], option_id)
+    assert index.refresh(mysql_conn) == 1
+
+    assert index.high_water == max_id + 20
+    assert index.participants == before + 2
+    assert {max_id + 10, max_id + 20} <= set(index.match(flt).ids())
+    # pencere yeniden okunsa da aynı katılımcı iki kez sayılmaz
+    assert index.refresh(mysql_conn) == 0
+    assert index.participants == before + 2
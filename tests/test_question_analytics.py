@@ -0,0 +1,278 @@
+"""
+build_question_analytics'in (anket geneli sabit sayıda sorgu + sayaç tabloları) eski soru
+başına sorgulayan uygulamayla aynı qstats'ı ürettiğini doğrular. Referans ham answers /
+responses satırlarını sayar; sayaçlar rebuild'den sonra hem senkron gönderim yolu
+(save_submission) hem de yazma kuyruğu (SubmissionQueue) üzerinden artırılır, böylece sayaç
+bakımındaki bir hata karşılaştırmada görünür.
+
+Tek bilinçli fark: top_words'te eşit sayılı kelimeler. Eski kod Counter.most_common
+sırasını (ilk görülme) kullanıyordu; yeni sorgu eşitlikte kelimeye göre (utf8mb4_bin,
+yani kod noktası sırası) dizer. Referans bu yüzden (-adet, kelime) ile sıralanır.
+"""
+import random
+from collections import Counter
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+import app as survey_app
+from bench.seed import seed
+
+
+def legacy_question_analytics(conn, survey_id, participant_count=0):
+    """Eski (soru başına sorgulayan) build_question_analytics; yalnız top_words sırası belirlenik."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT id, question_text, question_type
+            FROM questions
+            WHERE survey_id=%s
+            ORDER BY id ASC
+        """, (survey_id,))
+        questions = cur.fetchall()
+
+        qstats = []
+        for q in questions:
+            qid = q["id"]
+            qtype = q["question_type"]
+
+            cur.execute("""
+                SELECT COUNT(DISTINCT a.response_id) AS responders
+                FROM answers a
+                JOIN responses r ON r.id = a.response_id
+                WHERE r.survey_id=%s AND a.question_id=%s
+            """, (survey_id, qid))
+            responders = (cur.fetchone() or {}).get("responders", 0) or 0
+
+            item = {
+                "id": qid,
+                "question_text": q["question_text"],
+                "question_type": qtype,
+                "responders": responders,
+                "missing": max((participant_count or 0) - responders, 0),
+                "options": [],
+                "most": None,
+                "least": None,
+                "rating": None,
+                "text": None,
+            }
+
+            if qtype in ("single_choice", "multiple_choice"):
+                cur.execute("""
+                    SELECT id, option_text
+                    FROM options
+                    WHERE question_id=%s
+                    ORDER BY id ASC
+                """, (qid,))
+                opts = cur.fetchall()
+
+                cur.execute("""
+                    SELECT a.option_id, COUNT(*) AS cnt
+                    FROM answers a
+                    JOIN responses r ON r.id = a.response_id
+                    WHERE r.survey_id=%s AND a.question_id=%s AND a.option_id IS NOT NULL
+                    GROUP BY a.option_id
+                """, (survey_id, qid))
+                counts = {o["id"]: 0 for o in opts}
+                for r in cur.fetchall():
+                    if r["option_id"] in counts:
+                        counts[r["option_id"]] = int(r["cnt"] or 0)
+                base = responders if qtype == "single_choice" else (sum(counts.values()) or 0)
+
+                opt_rows = []
+                for o in opts:
+                    cnt = int(counts.get(o["id"], 0))
+                    pct = (cnt / base * 100.0) if base else 0.0
+                    opt_rows.append({"id": o["id"], "text": o["option_text"], "count": cnt, "pct": round(pct, 1)})
+
+                item["options"] = opt_rows
+                if opt_rows:
+                    item["most"] = max(opt_rows, key=lambda x: x["count"])
+                    item["least"] = min(opt_rows, key=lambda x: x["count"])
+
+            elif qtype == "rating":
+                cur.execute("""
+                    SELECT a.answer_number, a.answer_text
+                    FROM answers a
+                    JOIN responses r ON r.id = a.response_id
+                    WHERE r.survey_id=%s AND a.question_id=%s
+                """, (survey_id, qid))
+                vals = []
+                for r in cur.fetchall():
+                    v = r.get("answer_number")
+                    if v is None:
+                        t = (r.get("answer_text") or "").strip()
+                        if t.isdigit():
+                            v = int(t)
+                    if v is not None:
+                        vals.append(float(v))
+
+                if vals:
+                    dist = Counter(int(x) for x in vals)
+                    item["rating"] = {
+                        "n": len(vals),
+                        "mean": round(sum(vals) / len(vals), 2),
+                        "median": round(survey_app._median(vals), 2),
+                        "std": round(survey_app._std(vals), 2),
+                        "dist": [{"score": k, "count": dist[k]} for k in sorted(dist.keys())],
+                    }
+                else:
+                    item["rating"] = {"n": 0, "mean": None, "median": None, "std": None, "dist": []}
+
+            elif qtype == "text":
+                cur.execute("""
+                    SELECT a.answer_text
+                    FROM answers a
+                    JOIN responses r ON r.id = a.response_id
+                    WHERE r.survey_id=%s AND a.question_id=%s
+                      AND a.answer_text IS NOT NULL
+                      AND TRIM(a.answer_text) <> ''
+                """, (survey_id, qid))
+                texts = [rr["answer_text"] for rr in cur.fetchall() if rr.get("answer_text")]
+                n = len(texts)
+
+                tokens = []
+                for t in texts:
+                    tokens.extend(survey_app._tokenize_tr(t))
+                top_words = sorted(Counter(tokens).items(), key=lambda kv: (-kv[1], kv[0]))[:20]
+
+                item["text"] = {
+                    "n": n,
+                    "avg_len": round(sum(len(t) for t in texts) / n, 1) if n else 0.0,
+                    "top_words": [{"w": w, "c": c} for (w, c) in top_words],
+                }
+
+            qstats.append(item)
+
+    return qstats
+
+
+# Eşit sayılı kelimeler: her biri iki kez geçer, ilk görülme sırası alfabetik sıranın tersi;
+# 20 sınırı eşitlerin ortasından geçer.
+_TIED_WORDS = [f"kelime{chr(ord('z') - i)}" for i in range(24)]
+_TIED_ANSWERS = [" ".join(_TIED_WORDS[i:i + 6]) for i in range(0, 24, 6)] * 2 + ["sık sık sık tekrar"]
+
+
+def _random_form(rng, questions, participant_fields, skip_qids=()):
+    """take formunun gönderdiği alanlar; parse_submission bunları doğrular."""
+    form = MultiDict({"duration_seconds": str(rng.randint(20, 600))})
+    for f in participant_fields:
+        option_ids = [str(o["id"]) for o in f["options"]]
+        if f["field_type"] == "text":
+            form.add(f"pf_text_{f['id']}", rng.choice(["ankara", "izmir", "istanbul"]))
+        elif f["field_type"] == "single_choice":
+            form.add(f"pf_{f['id']}", rng.choice(option_ids))
+        else:
+            for oid in rng.sample(option_ids, rng.randint(1, len(option_ids))):
+                form.add(f"pf_{f['id']}", oid)
+
+    for q in questions:
+        qid = q["id"]
+        if qid in skip_qids:
+            continue
+        option_ids = [str(o["id"]) for o in q["options"]]
+        if q["question_type"] == "text":
+            form.add(f"question_text_{qid}", " ".join(rng.sample(["hızlı", "güzel", "pahalı", "yavaş", "iyi"], 2)))
+        elif q["question_type"] == "rating":
+            form.add(f"question_{qid}", str(rng.randint(1, 5)))
+        elif q["question_type"] == "single_choice":
+            form.add(f"question_{qid}", rng.choice(option_ids))
+        else:
+            for oid in rng.sample(option_ids, rng.randint(1, len(option_ids))):
+                form.add(f"question_{qid}", oid)
+    return form
+
+
+def _submit(mysql_conn, survey_id, skip_qids, count=40, random_seed=3):
+    """Yarısı senkron save_submission ile, yarısı yazma kuyruğundan; sayaçlar yazım yolunda artar."""
+    rng = random.Random(random_seed)
+    questions = survey_app.load_questions_with_options(mysql_conn, survey_id)
+    fields = survey_app.load_participant_fields_with_options(mysql_conn, survey_id)
+    submissions = []
+    for _ in range(count):
+        error, submission = survey_app.parse_submission(_random_form(rng, questions, fields, skip_qids), questions, fields)
+        assert error is None, error
+        submissions.append(submission)
+
+    half = count // 2
+    with mysql_conn.cursor() as cur:
+        for submission in submissions[:half]:
+            survey_app.save_submission(cur, survey_id, submission)
+            mysql_conn.commit()
+
+    queue = survey_app.SubmissionQueue(flush_size=8, flush_ms=20)
+    for submission in submissions[half:]:
+        assert queue.enqueue(survey_id, submission)
+    queue.stop()  # kuyruk boşalana kadar flush eder
+    assert queue.stats()["flushed"] == count - half
+
+
+@pytest.fixture(scope="module")
+def seeded_survey(mysql_conn):
+    manifest = seed(mysql_conn, surveys=1, participants=300, questions_per_type=2, random_seed=7)
+    survey_id = manifest["surveys"][0]["id"]
+
+    with mysql_conn.cursor() as cur:
+        cur.execute("SELECT id FROM questions WHERE survey_id=%s AND question_type='rating' ORDER BY id LIMIT 1", (survey_id,))
+        rating_qid = cur.fetchone()["id"]
+        cur.execute(
+            "INSERT INTO questions (survey_id, question_text, question_type, is_required) VALUES (%s, %s, 'text', 0)",
+            (survey_id, "Eşit sayılı kelimeler?")
+        )
+        tie_qid = cur.lastrowid
+
+        cur.execute("SELECT id FROM responses WHERE survey_id=%s ORDER BY id", (survey_id,))
+        response_ids = [r["id"] for r in cur.fetchall()]
+        for response_id, text in zip(response_ids, _TIED_ANSWERS):
+            cur.execute(
+                "INSERT INTO answers (response_id, question_id, answer_text) VALUES (%s, %s, %s)",
+                (response_id, tie_qid, text)
+            )
+
+        # eski sürümden kalan, puanı yalnız answer_text'te tutulan rating cevapları
+        cur.execute(
+            "DELETE FROM answers WHERE question_id=%s AND response_id IN (%s, %s, %s)",
+            (rating_qid, *response_ids[-3:])
+        )
+        for response_id, text in zip(response_ids[-3:], [" 4 ", "2", "çok iyi"]):
+            cur.execute(
+                "INSERT INTO answers (response_id, question_id, answer_text) VALUES (%s, %s, %s)",
+                (response_id, rating_qid, text)
+            )
+    mysql_conn.commit()
+
+    survey_app.rebuild_answer_counters(mysql_conn, survey_id)
+    survey_app.rebuild_text_index(mysql_conn, survey_id)
+    # eşit sayılı kelimeler sorusu boş bırakılır (ties testi bu sayıları bekler)
+    _submit(mysql_conn, survey_id, skip_qids={tie_qid})
+
+    with mysql_conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) AS c FROM participants WHERE survey_id=%s", (survey_id,))
+        participant_count = int(cur.fetchone()["c"])
+    return survey_id, participant_count, tie_qid
+
+
+def test_qstats_matches_legacy_for_every_question_type(mysql_conn, seeded_survey):
+    survey_id, participant_count, _ = seeded_survey
+
+    new = survey_app.build_question_analytics(mysql_conn, survey_id, participant_count)
+    old = legacy_question_analytics(mysql_conn, survey_id, participant_count)
+
+    assert {q["question_type"] for q in old} == {"single_choice", "multiple_choice", "rating", "text"}
+    assert [q["id"] for q in new] == [q["id"] for q in old]
+    for got, want in zip(new, old):
+        if want["rating"] is not None and want["rating"]["n"]:
+            for key in ("mean", "median", "std"):
+                assert got["rating"][key] == pytest.approx(want["rating"][key], abs=0.01), (want["id"], key)
+                got["rating"][key] = want["rating"][key]
+        assert got == want, want["id"]
+
+
+def test_top_words_ties_break_by_token(mysql_conn, seeded_survey):
+    survey_id, participant_count, tie_qid = seeded_survey
+
+    qstats = survey_app.build_question_analytics(mysql_conn, survey_id, participant_count)
+    top_words = next(q for q in qstats if q["id"] == tie_qid)["text"]["top_words"]
+
+    assert top_words[0] == {"w": "sık", "c": 3}
+    assert [w["w"] for w in top_words[1:]] == sorted(_TIED_WORDS)[:19]
+    assert all(w["c"] == 2 for w in top_words[1:])